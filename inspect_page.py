@@ -2,7 +2,9 @@
 """
 Opens TikTok upload page with your cookies and prints all interactive
 elements — helps find the correct selectors for schedule toggle and popups.
+Usage: uv run python inspect_page.py [--keep-open]
 """
+import argparse
 import time
 from pathlib import Path
 from tiktok_uploader.auth import AuthBackend
@@ -11,6 +13,15 @@ from tiktok_uploader.browsers import get_browser
 COOKIES_FILE = Path("cookies.txt")
 UPLOAD_URL = "https://www.tiktok.com/creator-center/upload?lang=en"
 
+ap = argparse.ArgumentParser(description=__doc__)
+ap.add_argument(
+    "--keep-open",
+    "-k",
+    action="store_true",
+    help="keep the browser open for 60s after dumping (default: exit at once)",
+)
+args = ap.parse_args()
+
 auth = AuthBackend(cookies=str(COOKIES_FILE))
 page = get_browser("chrome", headless=False)
 page = auth.authenticate_agent(page)
@@ -18,36 +29,35 @@ page = auth.authenticate_agent(page)
 print("Navigating to upload page…")
 page.goto(UPLOAD_URL)
 page.wait_for_selector("#root", timeout=60000)
-time.sleep(5)  # let the page fully settle
 
-# Dump all buttons and inputs visible on screen
+# Dump all buttons and inputs visible on screen.
+# Each section is one evaluate_all() round-trip instead of one per attribute.
 print("\n=== BUTTONS ===")
-for btn in page.locator("button:visible, [role='button']:visible").all()[:20]:
-    try:
-        print(f"  text={btn.inner_text()!r:40s}  class={btn.get_attribute('class')!r}")
-    except Exception:
-        pass
+rows = page.locator("button:visible, [role='button']:visible").evaluate_all(
+    "els => els.slice(0, 20).map(e => ({text: e.innerText, cls: e.getAttribute('class')}))"
+)
+for r in rows:
+    print(f"  text={r['text']!r:40s}  class={r['cls']!r}")
 
 print("\n=== INPUTS / CHECKBOXES ===")
-for inp in page.locator("input:visible, [role='switch']:visible").all()[:20]:
-    try:
-        print(
-            f"  type={inp.get_attribute('type')!r}  id={inp.get_attribute('id')!r}  class={inp.get_attribute('class')!r}"
-        )
-    except Exception:
-        pass
+rows = page.locator("input:visible, [role='switch']:visible").evaluate_all(
+    "els => els.slice(0, 20).map(e => ({type: e.getAttribute('type'),"
+    " id: e.getAttribute('id'), cls: e.getAttribute('class')}))"
+)
+for r in rows:
+    print(f"  type={r['type']!r}  id={r['id']!r}  class={r['cls']!r}")
 
 print("\n=== DIVS with 'schedule' in class/text ===")
-for el in page.locator(
-    "//*[contains(translate(@class,'SCHEDULE','schedule'),'schedule') or contains(translate(text(),'SCHEDULE','schedule'),'schedule')]"
-).all()[:10]:
-    try:
-        print(
-            f"  tag={el.evaluate('e=>e.tagName')!r}  text={el.inner_text()[:60]!r}  class={el.get_attribute('class')!r}"
-        )
-    except Exception:
-        pass
-
-print("\nDone — keeping browser open for 60s so you can inspect manually…")
-time.sleep(60)
+rows = page.locator(
+    "[class*='schedule' i], :text-matches('schedule', 'i')"
+).evaluate_all(
+    "els => els.slice(0, 10).map(e => ({tag: e.tagName,"
+    " text: (e.innerText || '').slice(0, 60), cls: e.getAttribute('class')}))"
+)
+for r in rows:
+    print(f"  tag={r['tag']!r}  text={r['text']!r}  class={r['cls']!r}")
+
+if args.keep_open:
+    print("\nDone — keeping browser open for 60s so you can inspect manually…")
+    time.sleep(60)
 page.context.browser.close()
@@ -1,41 +1,71 @@
 #!/usr/bin/env python3
 """
 Inspect the TikTok schedule UI — dumps HTML after clicking Schedule radio.
-Usage: uv run python inspect_schedule.py videos/IMG_0109.mp4
+Usage: uv run python inspect_schedule.py videos/IMG_0109.mp4 [--keep-open]
 """
-import sys, time, asyncio
+import argparse
+import re
+from collections import defaultdict
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
 COOKIES_FILE = "cookies.txt"
 
+KEYWORD_RE = re.compile(
+    r"(?P<datepicker>date[-_ ]?picker)"
+    r"|(?P<timepicker>time[-_ ]?picker)"
+    r"|(?P<schedule>schedule)"
+    r"|(?P<when_to_post>When to post)",
+    re.IGNORECASE,
+)
+
+# class + visible text for the first 20 matches, computed in-page in one call
+VISIBLE_ROWS_JS = """
+els => els.slice(0, 20).map(e => {
+    const r = e.getBoundingClientRect();
+    const vis = r.width > 0 && r.height > 0
+        && getComputedStyle(e).visibility !== 'hidden';
+    return {
+        cls: (e.getAttribute('class') || '').slice(0, 80),
+        text: vis ? (e.innerText || '').slice(0, 80).replace(/\\n/g, ' ') : '(hidden)',
+    };
+})
+"""
+
 
 def load_cookies(path):
-    cookies = []
+    """Parse a Netscape cookies.txt into Playwright cookie dicts (single pass)."""
     with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split("\t")
-            if len(parts) < 7:
-                continue
-            domain, _, path_c, secure, expires, name, value = parts[:7]
-            cookies.append(
-                {
-                    "domain": domain.lstrip("."),
-                    "path": path_c,
-                    "secure": secure.upper() == "TRUE",
-                    "name": name,
-                    "value": value,
-                    "sameSite": "None",
-                }
-            )
-    return cookies
+        rows = [
+            line.split("\t")
+            for raw in f
+            if (line := raw.strip()) and not line.startswith("#")
+        ]
+    return [
+        {
+            "domain": p[0].lstrip("."),
+            "path": p[2],
+            "secure": p[3].upper() == "TRUE",
+            "name": p[5],
+            "value": p[6],
+            "sameSite": "None",
+        }
+        for p in rows
+        if len(p) >= 7
+    ]
 
 
 def main():
-    video = Path(sys.argv[1] if len(sys.argv) > 1 else "videos/IMG_0109.mp4")
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("video", nargs="?", default="videos/IMG_0109.mp4")
+    ap.add_argument(
+        "--keep-open",
+        "-k",
+        action="store_true",
+        help="wait for Enter before closing the browser (default: exit at once)",
+    )
+    args = ap.parse_args()
+    video = Path(args.video)
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False, slow_mo=300)
@@ -46,7 +76,7 @@ def main():
         page.goto(
             "https://www.tiktok.com/tiktok-studio/upload", wait_until="domcontentloaded"
         )
-        time.sleep(3)
+        page.locator("input[type=file]").first.wait_for(state="attached", timeout=15000)
 
         # Dismiss cookie banner
         try:
@@ -60,12 +90,16 @@ def main():
         file_input = page.locator("input[type=file]").first
         file_input.set_input_files(str(video))
         print("Waiting for video to upload…")
-        time.sleep(10)
+        # Same "processed" marker the uploader waits on (resolution label)
+        page.locator("div[class*='resolution-label-text']").first.wait_for(
+            state="attached", timeout=120_000
+        )
 
         # Dismiss popup
         try:
             btn = page.locator(
-                "//button[contains(translate(., 'GOTIQUK', 'gotiquk'), 'got it')] | //button[contains(translate(., 'GOTIQUK', 'gotiquk'), 'ok')] | //div[contains(@class,'modal')]//button"
+                "button:has-text('Got it'), button:has-text('OK'),"
+                " div[class*='modal'] button"
             ).first
             if btn.is_visible(timeout=3000):
                 btn.click()
@@ -87,7 +121,13 @@ def main():
             except Exception:
                 continue
 
-        time.sleep(1)
+        # Wait for the date/time pickers rather than a fixed pause
+        try:
+            page.locator("div[class*='scheduled-picker']").first.wait_for(
+                state="visible", timeout=5000
+            )
+        except Exception:
+            print("Date/time pickers did not appear — dumping anyway")
 
         # Take screenshot
         page.screenshot(path="schedule_screenshot.png", full_page=False)
@@ -95,47 +135,33 @@ def main():
 
         # Dump all visible text and element info around the schedule area
         html = page.content()
-        # Look for date/time picker related HTML
-        import re
-
-        # Find relevant sections
-        for keyword in [
-            "date-picker",
-            "datepicker",
-            "time-picker",
-            "timepicker",
-            "schedule",
-            "When to post",
-        ]:
-            matches = list(
-                re.finditer(
-                    rf".{{0,200}}{re.escape(keyword)}.{{0,200}}", html, re.IGNORECASE
-                )
-            )
-            if matches:
-                print(f"\n--- Matches for '{keyword}' ---")
-                for m in matches[:3]:
-                    snippet = m.group(0).replace("\n", " ")
-                    print(snippet[:400])
+        # Look for date/time picker related HTML — one pass over the page
+        # for all keywords, tagged by named group.
+        hits: dict[str, list[str]] = defaultdict(list)
+        for m in KEYWORD_RE.finditer(html):
+            group = m.lastgroup or ""
+            if len(hits[group]) < 3:
+                hits[group].append(html[max(0, m.start() - 200) : m.end() + 200])
+        del html
+
+        for keyword, snippets in hits.items():
+            print(f"\n--- Matches for '{keyword}' ---")
+            for snippet in snippets:
+                print(snippet.replace("\n", " ")[:400])
 
         # Also dump all input/div elements near schedule
         print("\n--- All visible elements after Schedule click ---")
-        elements = page.locator(
-            "xpath=//div[contains(@class,'schedule') or contains(@class,'date') or contains(@class,'time') or contains(@class,'picker') or contains(@class,'calendar')]"
-        ).all()
-        for el in elements[:20]:
-            try:
-                cls = el.get_attribute("class") or ""
-                txt = (
-                    el.inner_text()[:80].replace("\n", " ")
-                    if el.is_visible()
-                    else "(hidden)"
-                )
-                print(f"  class={cls[:80]!r}  text={txt!r}")
-            except Exception:
-                pass
-
-        input("Press Enter to close browser…")
+        # One CSS query (native selector engine) instead of an XPath walk, and
+        # one evaluate_all() for class/visibility/text instead of 3 calls each
+        rows = page.locator(
+            "div[class*='schedule' i], div[class*='date' i], div[class*='time' i],"
+            " div[class*='picker' i], div[class*='calendar' i]"
+        ).evaluate_all(VISIBLE_ROWS_JS)
+        for r in rows:
+            print(f"  class={r['cls']!r}  text={r['text']!r}")
+
+        if args.keep_open:
+            input("Press Enter to close browser…")
         browser.close()
 
 
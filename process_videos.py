@@ -9,17 +9,21 @@ with appropriate hashtags.
 """
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import os
+import random
 import re
-import subprocess
-import tempfile
+import sys
+import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 
 from shazamio import Shazam
-from tiktok_uploader.upload import TikTokUploader
 
 # ---------------------------------------------------------------------------
 # Config
@@ -27,8 +31,10 @@ from tiktok_uploader.upload import TikTokUploader
 VIDEOS_DIR = Path("videos")
 COOKIES_FILE = Path("cookies.txt")
 STATE_FILE = Path("uploaded.json")
+LOCK_FILE = STATE_FILE.with_suffix(".lock")  # serialises concurrent upload runs
 
-VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".m4v", ".webm"}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".m4v", ".webm"})
+_VIDEO_EXT_TUPLE = tuple(VIDEO_EXTENSIONS)  # for str.endswith — already lowercase
 
 MUSIC_TAGS = (
     "#SpeedRecords #TikTokVideos #TimesMusic #TrendingSongs #HitSong #PunjabiTikTok"
@@ -40,12 +46,19 @@ WINDOW_START_HOUR = 9  # 9:00 AM
 WINDOW_END_HOUR = 22  # 10:00 PM (last slot is 22:00)
 SCHEDULE_BUFFER_MIN = 25  # TikTok requires ≥ 20 min in the future
 
+# Max videos recognised at once (ffmpeg + Shazam round-trip are I/O-bound)
+SHAZAM_CONCURRENCY = max(1, int(os.environ.get("SHAZAM_CONCURRENCY", "4")))
+# Parallel ffmpeg decodes (CPU-bound), and decoded clips (~1 MB each) allowed
+# to wait for a free Shazam slot
+DECODE_WORKERS = min(4, os.cpu_count() or 1)
+AUDIO_QUEUE_DEPTH = 4
+
 
 # ---------------------------------------------------------------------------
 # State persistence  (uploaded.json)
 # ---------------------------------------------------------------------------
 def load_state() -> dict:
-    """Return {uploaded: [filename, ...], last_slot: ISO-str | None}."""
+    """Return {uploaded: [filename, ...], last_slot: ISO-str | None, ...}."""
     if STATE_FILE.exists():
         try:
             return json.loads(STATE_FILE.read_text())
@@ -55,7 +68,66 @@ def load_state() -> dict:
 
 
 def save_state(state: dict) -> None:
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    """Write *state* atomically — a crash mid-write never truncates the file."""
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    os.replace(tmp, STATE_FILE)
+
+
+def refresh_state(state: dict) -> None:
+    """Reload *state* from disk, keeping the audio probes made by this run."""
+    probes = state.get("audio_probes", {})
+    state.update(load_state())
+    state.setdefault("audio_probes", {}).update(probes)
+
+
+@contextlib.contextmanager
+def upload_lock() -> Iterator[None]:
+    """
+    Hold an exclusive OS lock on LOCK_FILE for the duration of the block.
+
+    A second process_videos.py run blocks here until the first one finishes, so two
+    runs never drive the same cookies / browser profile at once. The lock is
+    released by the OS if the holder dies, so there is no stale-lock cleanup.
+    """
+    with open(LOCK_FILE, "a+") as fh:
+        if sys.platform == "win32":
+            import msvcrt
+
+            fh.seek(0)
+            try:
+                msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                logger.info("Another upload run is in progress — waiting…")
+                while True:
+                    try:
+                        # LK_LOCK retries for ~10 s before raising
+                        msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        else:
+            import fcntl
+
+            try:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                logger.info("Another upload run is in progress — waiting…")
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+
+        # Informational only — who holds the lock and since when
+        fh.seek(0)
+        fh.truncate()
+        fh.write(json.dumps({"pid": os.getpid(), "started_at": time.time()}))
+        fh.flush()
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
 
 
 # ---------------------------------------------------------------------------
@@ -84,11 +156,17 @@ for _h in logging.root.handlers:
 # ---------------------------------------------------------------------------
 # Scheduling helpers
 # ---------------------------------------------------------------------------
-def next_upload_slots(count: int, last_slot: datetime | None = None) -> list[datetime]:
+def last_booked_slot(state: dict) -> datetime | None:
+    """Return state["last_slot"] as a local-aware datetime, or None."""
+    last_slot_iso: str | None = state.get("last_slot")
+    return datetime.fromisoformat(last_slot_iso).astimezone() if last_slot_iso else None
+
+
+def iter_upload_slots(last_slot: datetime | None = None) -> Iterator[datetime]:
     """
-    Return *count* consecutive hourly slots (local time) inside the
-    10:00–21:00 window, each at least SCHEDULE_BUFFER_MIN minutes from now
-    AND strictly after *last_slot* (if provided) so re-runs never double-book.
+    Yield consecutive hourly slots (local time) inside the upload window,
+    the first at least SCHEDULE_BUFFER_MIN minutes from now AND strictly
+    after *last_slot* (if provided) so re-runs never double-book.
     Slots land on the exact hour (e.g. 11:00, 12:00 …).
     """
     now = datetime.now().astimezone()  # local-aware datetime
@@ -117,9 +195,8 @@ def next_upload_slots(count: int, last_slot: datetime | None = None) -> list[dat
             hour=WINDOW_START_HOUR, minute=0, second=0, microsecond=0
         )
 
-    slots: list[datetime] = []
-    while len(slots) < count:
-        slots.append(candidate)
+    while True:
+        yield candidate
         candidate = candidate + timedelta(hours=1)
         # Wrap to next day if we've gone past the window
         if candidate.hour > WINDOW_END_HOUR:
@@ -127,73 +204,184 @@ def next_upload_slots(count: int, last_slot: datetime | None = None) -> list[dat
                 hour=WINDOW_START_HOUR, minute=0, second=0, microsecond=0
             )
 
-    return slots
-
 
 # ---------------------------------------------------------------------------
 # Audio extraction
 # ---------------------------------------------------------------------------
-def extract_audio(video_path: Path, output_path: Path) -> bool:
-    """Extract first 30 s of audio from *video_path* into a WAV at *output_path*."""
+async def has_audio(video_path: Path, probes: dict | None = None) -> bool:
+    """Return True if ffprobe finds an audio stream in *video_path*.
+
+    Silent clips can skip the ffmpeg decode and Shazam round-trip entirely.
+    If ffprobe is unavailable or fails, assume audio so recognition still runs.
+    *probes* (state["audio_probes"]) maps file name → [mtime_ns, size, result]
+    so unchanged files are not probed again on later runs.
+    """
+    st = video_path.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    if probes is not None:
+        cached = probes.get(video_path.name)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+
     try:
-        result = subprocess.run(
-            [
-                "ffmpeg",
-                "-i",
-                str(video_path),
-                "-vn",  # strip video
-                "-acodec",
-                "pcm_s16le",
-                "-ar",
-                "44100",
-                "-ac",
-                "1",  # mono
-                "-t",
-                "30",  # 30 s is plenty for Shazam
-                "-y",  # overwrite temp file if exists
-                str(output_path),
-            ],
-            capture_output=True,
-            timeout=60,
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "a",
+            "-show_entries",
+            "stream=codec_type",
+            "-of",
+            "csv=p=0",
+            str(video_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        if result.returncode != 0:
-            logger.debug("ffmpeg stderr: %s", result.stderr.decode(errors="replace"))
-            return False
+    except FileNotFoundError as exc:
+        logger.debug("ffprobe unavailable (%s) — assuming audio", exc)
         return True
-    except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
+
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return True
+
+    if proc.returncode != 0:
+        return True
+    result = b"audio" in stdout
+    if probes is not None:
+        probes[video_path.name] = [*stamp, result]
+    return result
+
+
+async def extract_audio(video_path: Path) -> bytes | None:
+    """Return the first 30 s of audio from *video_path* as in-memory WAV bytes."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            # -ss/-t before -i: demux only the first 30 s (plenty for Shazam)
+            "-ss",
+            "0",
+            "-t",
+            "30",
+            "-i",
+            str(video_path),
+            "-map",
+            "0:a:0",  # first audio track only — never touch video packets
+            "-vn",
+            "-acodec",
+            "pcm_s16le",
+            "-ar",
+            "16000",  # Shazam fingerprints at 16 kHz; 44.1 kHz is wasted bytes
+            "-ac",
+            "1",  # mono
+            "-f",
+            "wav",
+            "pipe:1",  # stream to stdout — no temp file round-trip
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
         logger.error("ffmpeg error: %s", exc)
-        return False
+        return None
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.error("ffmpeg error: timed out after 60 s on %s", video_path.name)
+        return None
+
+    if proc.returncode != 0 or not stdout:
+        logger.debug("ffmpeg stderr: %s", stderr.decode(errors="replace"))
+        return None
+    return stdout
 
 
 # ---------------------------------------------------------------------------
 # Shazam recognition
 # ---------------------------------------------------------------------------
+SHAZAM_RETRY_ATTEMPTS = 3
+SHAZAM_RETRY_BASE_SEC = 1.0  # back-off: 1 s → 2 s (+ jitter)
+_RETRYABLE_MARKERS = (
+    "429",
+    "too many requests",
+    "rate limit",
+    "rate-limit",
+    "ratelimit",
+    "quota",
+    "timeout",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shazam() -> Shazam:
+    """Return the process-wide Shazam client (built on first use)."""
+    return Shazam()
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """True for rate-limit / transient network errors worth retrying."""
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    msg = str(exc).lower()
+    return any(marker in msg for marker in _RETRYABLE_MARKERS)
+
+
+async def _recognise_with_retry(
+    data: bytes,
+    attempts: int = SHAZAM_RETRY_ATTEMPTS,
+    base: float = SHAZAM_RETRY_BASE_SEC,
+) -> dict:
+    """Call Shazam on WAV *data*, retrying rate-limit/transient errors with back-off."""
+    shazam = _get_shazam()
+    for i in range(attempts - 1):
+        try:
+            return await shazam.recognize(data)
+        except Exception as exc:  # noqa: BLE001
+            if not _is_retryable(exc):
+                raise
+            delay = base * 2**i + random.uniform(0, 0.25)
+            logger.warning(
+                "  › Shazam busy (%s) — retrying in %.1f s (%d/%d)",
+                exc,
+                delay,
+                i + 1,
+                attempts - 1,
+            )
+            await asyncio.sleep(delay)
+    return await shazam.recognize(data)
+
+
 async def recognize_song(video_path: Path) -> dict | None:
     """Return the Shazam result dict for *video_path*, or None on failure."""
-    tmp_fd, tmp_name = tempfile.mkstemp(suffix=".wav")
-    os.close(tmp_fd)
-    tmp_path = Path(tmp_name)
     try:
         logger.info("  › extracting audio…")
-        if not extract_audio(video_path, tmp_path):
+        audio = await extract_audio(video_path)
+        if audio is None:
             logger.warning("  › audio extraction failed — skipping Shazam")
             return None
 
         logger.info("  › querying Shazam…")
-        shazam = Shazam()
-        result = await shazam.recognize(str(tmp_path))
-        return result
+        return await _recognise_with_retry(audio)
     except Exception as exc:  # noqa: BLE001
         logger.error("  › Shazam error: %s", exc)
         return None
-    finally:
-        if tmp_path.exists():
-            tmp_path.unlink()
 
 
 # ---------------------------------------------------------------------------
 # Description builder
 # ---------------------------------------------------------------------------
+# Compiled once at import — these run for every title/artist we tag.
+_RE_BRACKETS = re.compile(r"\s*[\(\[\{][^\)\]\}]*[\)\]\}]")
+_RE_PUNCT = re.compile(r"""[\"\'`\-–—]+""")
+_RE_ARTIST_SEP = re.compile(r"\s*(?:&|,|ft\.|feat\.)\s*", re.IGNORECASE)
+
+
 def _clean_text(text: str) -> str:
     """Strip parenthetical/bracketed annotations and extra punctuation from song/artist text.
 
@@ -202,9 +390,9 @@ def _clean_text(text: str) -> str:
          "Song - feat. Artist"                       → 'Song   feat  Artist'
     """
     # Remove anything inside (), [], {} — handles nested quotes too
-    text = re.sub(r"\s*[\(\[\{][^\)\]\}]*[\)\]\}]", "", text)
+    text = _RE_BRACKETS.sub("", text)
     # Remove stray punctuation left over (quotes, dashes at start/end)
-    text = re.sub(r"""[\"\'`\-–—]+""", " ", text)
+    text = _RE_PUNCT.sub(" ", text)
     return text.strip()
 
 
@@ -233,16 +421,13 @@ def build_description(shazam_result: dict | None) -> str:
                 # Split on separators (&, ,, ft., feat.) to keep each full
                 # artist name together, then camelCase the whole name.
                 # "Tarsem Jassar & Deep Jandu" → #TarsemJassar #DeepJandu
-                artist_names = re.split(
-                    r"\s*(?:&|,|ft\.|feat\.)\s*", artist, flags=re.IGNORECASE
+                parts.extend(
+                    _to_hashtag(name)
+                    for name in _RE_ARTIST_SEP.split(artist)
+                    if name.strip()
                 )
-                for name in artist_names:
-                    name = name.strip()
-                    if name:
-                        parts.append(_to_hashtag(name))
 
-            parts.append(MUSIC_TAGS)
-            return " ".join(parts)
+            return f"{' '.join(parts)} {MUSIC_TAGS}"
 
     return DEFAULT_TAGS
 
@@ -250,42 +435,108 @@ def build_description(shazam_result: dict | None) -> str:
 # ---------------------------------------------------------------------------
 # Phase 1 (async): recognise all songs, return jobs list
 # ---------------------------------------------------------------------------
-async def recognise_all(videos: list[Path]) -> list[tuple[Path, str, str | None]]:
-    """Return list of (video_path, description, sound_query) for every video."""
-    jobs: list[tuple[Path, str, str | None]] = []
-    for video in videos:
-        logger.info("")
-        logger.info("━" * 55)
-        logger.info("Recognising: %s", video.name)
-        result = await recognize_song(video)
-        sound: str | None = None
-        if result and "track" in result:
-            track = result["track"]
-            title = track.get("title", "").strip()
-            artist = track.get("subtitle", "").strip()
-            logger.info("  ✓ Song: %s — %s", title, artist)
-            if title or artist:
-                # Use only the first credited artist for the search query
-                first_artist = re.split(
-                    r"\s*(?:&|,|ft\.|feat\.)\s*", artist, maxsplit=1
-                )[0].strip()
-                sound = f"{title} {first_artist}".strip()
-        else:
-            logger.info("  ✗ No song recognised → using default tags")
-        jobs.append((video, build_description(result), sound))
-    return jobs
+def _describe(video: Path, result: dict | None) -> tuple[str, str | None]:
+    """Turn a Shazam *result* into (description, sound_query) and log it."""
+    sound: str | None = None
+    if result and "track" in result:
+        track = result["track"]
+        title = track.get("title", "").strip()
+        artist = track.get("subtitle", "").strip()
+        logger.info("  ✓ %s: %s — %s", video.name, title, artist)
+        if title or artist:
+            # Use only the first credited artist for the search query
+            first_artist = _RE_ARTIST_SEP.split(artist, maxsplit=1)[0].strip()
+            sound = f"{title} {first_artist}".strip()
+    else:
+        logger.info("  ✗ %s: no song recognised → using default tags", video.name)
+    return build_description(result), sound
+
+
+async def recognise_all(
+    videos: list[Path], probes: dict | None = None
+) -> list[tuple[Path, str, str | None]]:
+    """Return list of (video_path, description, sound_query) for every video.
+
+    Runs as a two-stage pipeline: DECODE_WORKERS ffmpeg decodes feed a queue
+    (at most AUDIO_QUEUE_DEPTH clips deep) that SHAZAM_CONCURRENCY recognisers
+    drain, so CPU-bound decoding overlaps the network-bound Shazam calls.
+    The returned list keeps the order of *videos*; *probes* is passed to has_audio.
+    """
+    logger.info("")
+    logger.info("━" * 55)
+    results: list[dict | None] = [None] * len(videos)
+    pending = iter(enumerate(videos))
+    decoded: asyncio.Queue[tuple[int, bytes] | None] = asyncio.Queue(
+        maxsize=AUDIO_QUEUE_DEPTH
+    )
+
+    async def decoder() -> None:
+        for i, video in pending:
+            logger.info("Recognising: %s", video.name)
+            try:
+                if not await has_audio(video, probes):
+                    logger.info(
+                        "  › %s has no audio track — skipping Shazam", video.name
+                    )
+                    continue
+                audio = await extract_audio(video)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("  › %s: audio extraction error: %s", video.name, exc)
+                continue
+            if audio is None:
+                logger.warning(
+                    "  › %s: audio extraction failed — skipping Shazam", video.name
+                )
+                continue
+            await decoded.put((i, audio))
+
+    async def recogniser() -> None:
+        while (item := await decoded.get()) is not None:
+            i, audio = item
+            try:
+                results[i] = await _recognise_with_retry(audio)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("  › %s: Shazam error: %s", videos[i].name, exc)
+
+    consumers = [asyncio.create_task(recogniser()) for _ in range(SHAZAM_CONCURRENCY)]
+    await asyncio.gather(*(decoder() for _ in range(DECODE_WORKERS)))
+    for _ in consumers:
+        await decoded.put(None)
+    await asyncio.gather(*consumers)
+
+    return [
+        (video, *_describe(video, result)) for video, result in zip(videos, results)
+    ]
 
 
 # ---------------------------------------------------------------------------
 # Phase 2 (sync): upload with schedule — must run outside asyncio loop
 # ---------------------------------------------------------------------------
-def upload_all(
-    jobs: list[tuple[Path, str, str | None]], slots: list[datetime], state: dict
-) -> None:
+def upload_all(jobs: list[tuple[Path, str, str | None]], state: dict) -> None:
+    with upload_lock():
+        # Another run may have booked videos/slots while we were waiting.
+        refresh_state(state)
+        save_state(state)
+        _upload_jobs(jobs, state)
+
+
+def _upload_jobs(jobs: list[tuple[Path, str, str | None]], state: dict) -> None:
+    # Imported here so Playwright only loads once there is something to upload.
+    from tiktok_uploader.upload import TikTokUploader
+
     uploader = TikTokUploader(cookies=str(COOKIES_FILE), headless=True)
     failed: list[str] = []
+    # In-memory mirror of state["uploaded"] for O(1) membership checks.
+    done: set[str] = set(state["uploaded"])
+
+    for video, description, sound in jobs:
+        if video.name in done:
+            logger.info("Skipping %s — already scheduled", video.name)
+            continue
 
-    for (video, description, sound), slot in zip(jobs, slots):
+        # Recompute from the last *booked* slot each time so a failed upload
+        # doesn't burn its hour and a slow run never hands out a stale slot.
+        slot = next(iter_upload_slots(last_booked_slot(state)))
         logger.info("")
         logger.info("━" * 55)
         logger.info("Uploading : %s", video.name)
@@ -303,6 +554,7 @@ def upload_all(
             )
             logger.info("  ✓ Scheduled successfully")
             state["uploaded"].append(video.name)
+            done.add(video.name)
             state["last_slot"] = slot.isoformat()
             save_state(state)
         except Exception as exc:  # noqa: BLE001
@@ -331,17 +583,18 @@ def main() -> None:
         return
 
     VIDEOS_DIR.mkdir(exist_ok=True)
-    all_videos = sorted(
-        f for f in VIDEOS_DIR.iterdir() if f.suffix.lower() in VIDEO_EXTENSIONS
-    )
+    # scandir's DirEntry caches the file type, so is_file() needs no extra stat
+    with os.scandir(VIDEOS_DIR) as entries:
+        all_videos = sorted(
+            Path(e.path)
+            for e in entries
+            if e.name.lower().endswith(_VIDEO_EXT_TUPLE) and e.is_file()
+        )
 
     # --- load state and skip already-uploaded videos -------------------------
     state = load_state()
     already_done: set[str] = set(state.get("uploaded", []))
-    last_slot_iso: str | None = state.get("last_slot")
-    last_slot: datetime | None = (
-        datetime.fromisoformat(last_slot_iso).astimezone() if last_slot_iso else None
-    )
+    last_slot = last_booked_slot(state)
 
     videos = [v for v in all_videos if v.name not in already_done]
     skipped = len(all_videos) - len(videos)
@@ -356,17 +609,17 @@ def main() -> None:
     logger.info("Found %d new video(s) in %s/", len(videos), VIDEOS_DIR)
 
     # --- compute slots -------------------------------------------------------
-    slots = next_upload_slots(len(videos), last_slot=last_slot)
+    slots = islice(iter_upload_slots(last_slot), len(videos))
     logger.info("")
-    logger.info("Scheduled upload slots (local time):")
+    logger.info("Planned upload slots (local time):")
     for i, (v, s) in enumerate(zip(videos, slots), 1):
         logger.info("  %d. %-30s → %s", i, v.name, s.strftime("%Y-%m-%d %H:%M %Z"))
 
     # --- phase 1: async song recognition -------------------------------------
-    jobs = asyncio.run(recognise_all(videos))
+    jobs = asyncio.run(recognise_all(videos, state.setdefault("audio_probes", {})))
 
     # --- phase 2: sync upload (Playwright sync API must be outside asyncio) --
-    upload_all(jobs, slots, state)
+    upload_all(jobs, state)
 
 
 if __name__ == "__main__":
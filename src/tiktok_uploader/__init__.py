@@ -2,14 +2,38 @@
 TikTok Uploader Initialization
 """
 
+import importlib
 import logging
 from os.path import abspath, dirname, join
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from tiktok_uploader.settings import TikTokConfig
+    from tiktok_uploader.upload import TikTokUploader, upload_video, upload_videos
+
+
+class _LazyConfig:
+    """
+    Stands in for the TikTokConfig, reading and validating config.toml on
+    first attribute access instead of at import time
+    """
+
+    _config: "TikTokConfig | None" = None
+
+    def _load(self) -> "TikTokConfig":
+        if self._config is None:
+            from tiktok_uploader.settings import load_config
+
+            self._config = load_config(join(config_dir, "config.toml"))
+        return self._config
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
 
-from tiktok_uploader.settings import load_config
 
 ## Load Config
 config_dir = abspath(dirname(__file__))
-config = load_config(join(config_dir, "config.toml"))
+config = cast("TikTokConfig", _LazyConfig())
 
 ## Setup Logging
 logger = logging.getLogger(__name__)
@@ -17,10 +41,17 @@ logger.setLevel(logging.DEBUG)
 # No custom handler — let records propagate to the root logger
 # so callers can configure formatting and filtering in one place.
 
-from tiktok_uploader.upload import (
-    TikTokUploader,
-    upload_video,
-    upload_videos,
-)  # noqa: E402, I001
-
 __all__ = ["TikTokUploader", "upload_video", "upload_videos"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily re-exports the upload API (PEP 562) so that `import tiktok_uploader`
+    does not pull in Playwright until one of these names is first used
+    """
+    if name in __all__:
+        upload = importlib.import_module("tiktok_uploader.upload")
+        value = getattr(upload, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
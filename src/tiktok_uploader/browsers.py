@@ -1,8 +1,10 @@
 """Gets the browser's given the user's input"""
 
+import weakref
 from typing import Any, Literal
+from urllib.parse import urlsplit
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.sync_api import Browser, Page, Playwright, Route, sync_playwright
 
 from tiktok_uploader import config
 from tiktok_uploader.types import ProxyDict
@@ -10,6 +12,30 @@ from tiktok_uploader.types import ProxyDict
 # Type alias for supported browsers
 browser_t = Literal["chrome", "firefox", "webkit", "edge", "safari", "chromium"]
 
+# The Playwright instance started for each browser, stopped along with it
+_PLAYWRIGHTS: "weakref.WeakKeyDictionary[Browser, Playwright]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Keeps the renderer from throttling or doing work the upload flow never needs
+CHROMIUM_ARGS = [
+    "--disable-features=Translate,BackForwardCache,CalculateNativeWinOcclusion",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+    "--mute-audio",
+]
+
+# Skips TikTok Studio's entry animations so elements settle immediately
+DISABLE_ANIMATIONS_SCRIPT = """
+document.addEventListener("DOMContentLoaded", () => {
+    const style = document.createElement("style");
+    style.textContent =
+        "*, *::before, *::after { animation: none !important; transition: none !important; }";
+    document.head.appendChild(style);
+});
+"""
+
 
 def get_browser(
     name: browser_t = "chrome",
@@ -40,6 +66,11 @@ def get_browser(
         ],
     }
 
+    if browser_type is p.chromium:
+        launch_args["args"] += CHROMIUM_ARGS
+        if "image" in config.blocked_resource_types:
+            launch_args["args"].append("--blink-settings=imagesEnabled=false")
+
     if name == "chrome":
         launch_args["channel"] = "chrome"
     elif name == "edge":
@@ -54,6 +85,7 @@ def get_browser(
             launch_args["proxy"]["password"] = proxy["password"]
 
     browser = browser_type.launch(**launch_args)
+    _PLAYWRIGHTS[browser] = p
 
     # Create a new context with stealth-like options if needed
     # For now, we use standard context but set locale/timezone if passed in kwargs
@@ -61,6 +93,7 @@ def get_browser(
 
     context_args: dict[str, Any] = {
         "viewport": {"width": 1280, "height": 720},
+        "device_scale_factor": 1,
         "user_agent": config.disguising.user_agent,
         "locale": "en-US",
     }
@@ -73,8 +106,42 @@ def get_browser(
             get: () => undefined
         });
     """)
+    if config.disable_animations:
+        context.add_init_script(DISABLE_ANIMATIONS_SCRIPT)
+
+    if config.blocked_resource_types or config.blocked_hosts:
+        context.route("**/*", _block_unneeded_requests)
 
     page = context.new_page()
     page.set_default_timeout(config.implicit_wait * 1000)  # Convert seconds to ms
 
     return page
+
+
+def close_browser(page: Page) -> None:
+    """
+    Closes the page's browser and stops the Playwright instance that started it
+    """
+    browser = page.context.browser
+    if browser is None:
+        return
+    browser.close()
+    playwright = _PLAYWRIGHTS.pop(browser, None)
+    if playwright is not None:
+        playwright.stop()
+
+
+def _block_unneeded_requests(route: Route) -> None:
+    """
+    Aborts requests for the configured resource types and hosts (e.g.
+    trackers), letting everything else through
+    """
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    if request.resource_type in config.blocked_resource_types or any(
+        host == blocked or host.endswith("." + blocked)
+        for blocked in config.blocked_hosts
+    ):
+        route.abort()
+    else:
+        route.continue_()
@@ -129,6 +129,13 @@ class TikTokConfig(StrictModel):
     supported_image_file_types: list[str]
     max_description_length: PositiveChars
 
+    # Request blocking
+    blocked_resource_types: list[str] = []
+    blocked_hosts: list[str] = []
+
+    # Skip CSS animations/transitions
+    disable_animations: bool = False
+
     # Nested
     paths: Paths
     disguising: Disguising
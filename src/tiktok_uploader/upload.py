@@ -6,25 +6,238 @@ Key Classes
 TikTokUploader : Client for uploading videos to TikTok
 """
 
+import atexit
+import copy
 import datetime
 import logging
+import re
+import threading
 import time
+import weakref
+from calendar import month_name
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from os.path import abspath, exists
-from typing import Any, Literal
+from typing import Any, Literal, NamedTuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import pytz
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, expect
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from tiktok_uploader import config
 from tiktok_uploader.auth import AuthBackend
-from tiktok_uploader.browsers import get_browser
+from tiktok_uploader.browsers import close_browser, get_browser
 from tiktok_uploader.types import Cookie, ProxyDict, VideoDict
 from tiktok_uploader.utils import bold, green, red
 
 logger = logging.getLogger(__name__)
 
+_UTC = datetime.timezone.utc
+
+# Returns `.checked` (or null if missing) for each XPath in a single round-trip
+_CHECKED_STATES_JS = """
+xpaths => xpaths.map(xpath => {
+    const el = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return el ? el.checked : null;
+})
+"""
+
+# First word of each mention suggestion's text, or null for hidden suggestions
+_MENTION_USER_IDS_JS = """
+els => els.map(el =>
+    el.getClientRects().length > 0 ? el.innerText.split(" ")[0] : null
+)
+"""
+
+# Whether the hashtag popover's first suggestion (located by XPath) is for
+# the whole typed tag rather than a prefix of it
+_HASHTAG_SUGGESTED_JS = """
+([xpath, tag]) => {
+    const box = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (!box) return false;
+    const first = [box, ...box.querySelectorAll("*")].find(
+        el => el.children.length === 0 && el.textContent.trim()
+    );
+    const text = first ? first.textContent.trim().replace(/^#/, "") : "";
+    return text.toLowerCase().startsWith(tag.toLowerCase());
+}
+"""
+
+# Whether a mention suggestion (user ids located by XPath) shows the username
+_MENTION_SUGGESTED_JS = """
+([xpath, username]) => {
+    const ids = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (let i = 0; i < ids.snapshotLength; i++) {
+        const id = ids.snapshotItem(i).innerText.split(" ")[0];
+        if (id.toLowerCase() === username.toLowerCase()) return true;
+    }
+    return false;
+}
+"""
+
+# Whether the post button (located by XPath) has been enabled by TikTok
+_POST_ENABLED_JS = """
+xpath => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue?.getAttribute("data-disabled") === "false"
+"""
+
+# Whether the cover preview (located by XPath) shows a different image
+_COVER_CHANGED_JS = """
+([xpath, oldSrc]) => {
+    const el = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return !!el && el.getAttribute("src") !== oldSrc;
+}
+"""
+
+# Returns the index of the first XPath matching a rendered element, or -1
+_FIRST_VISIBLE_JS = """
+xpaths => xpaths.findIndex(xpath => {
+    const el = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return !!el && el.getClientRects().length > 0;
+})
+"""
+
+# Sound editor selectors, built once. The Sounds button candidates are joined
+# into one XPath union so a single wait covers all of them.
+_SOUND_SEARCH_SELECTORS = (
+    "input[placeholder*='search sounds' i]",
+    "[class*='sound' i] input[placeholder*='search' i]",
+)
+# Accessible names of the '+' button on a search result (aria-label, title or text)
+_SOUND_ADD_NAME_RE = re.compile(r"^(add|\+)$", re.IGNORECASE)
+# The Sounds panel: the outermost sound container holding the search box
+_SOUND_PANEL_SELECTOR = "[class*='sound' i]:has(input[placeholder*='search' i])"
+# Tried in order inside the Sounds panel, after the explicit Add/'+' button
+_SOUND_ADD_SELECTORS = (
+    # Any list item's last button (the + circle at right of row)
+    "li button:last-of-type",
+    # Any div-row's last button
+    "[role='listitem'] button:last-of-type, [role='option'] button:last-of-type",
+    # Last SVG button that is NOT the search/clear/close/back button
+    "button:has(svg):not([class*='close']):not([class*='clear'])"
+    ":not([class*='back']):not([class*='search']) >> nth=-1",
+)
+_SOUND_PANEL_CLOSE_XPATHS = (
+    "//div[contains(@class,'SoundPanel') or contains(@class,'Sounds')]//button[@aria-label='Close' or @aria-label='close' or @title='Close']",
+    "//div[contains(text(),'Sounds')]/following-sibling::button",
+    "//div[@class[contains(.,'sound') or contains(.,'Sound')]]//button[.//svg][1]",
+)
+_VISIBILITY_DROPDOWN_SELECTOR = (
+    "[data-e2e='video_visibility_container'] button[role='combobox']"
+)
+
+# Schedule picker selectors. The "When to post" radio <input> is visually
+# hidden, so the visible label/span is clicked; the radio is the fallback.
+_SCHEDULE_LABEL_XPATH = (
+    "//label[contains(normalize-space(.), 'Schedule')]"
+    " | //span[normalize-space(text())='Schedule']"
+    " | //div[normalize-space(text())='Schedule']"
+)
+# Tried in order: a union would pick the first in the DOM, e.g. the "Now" radio
+_SCHEDULE_RADIO_XPATHS = (
+    "//input[@type='radio'][2]",
+    "//label[contains(.,'Schedule')]/input",
+    "//*[@id='tux-1']",
+)
+# The picker widgets have no ids or data-e2e hooks, so they are matched on
+# class substrings with CSS, which the browser resolves natively
+_SCHEDULED_PICKER_SELECTOR = "div[class*='scheduled-picker']"
+# date input value looks like "2026-02-26", time input like "22:30"
+_DATE_INPUT_SELECTOR = f"{_SCHEDULED_PICKER_SELECTOR} input[value*='-']"
+_TIME_INPUT_SELECTOR = f"{_SCHEDULED_PICKER_SELECTOR} input:not([value*='-'])"
+_CALENDAR_SELECTOR = "div[class*='calendar-wrapper'], div[class*='calendar']"
+_MONTH_TITLE_SELECTOR = "span[class*='month-title'], div[class*='month-title']"
+_DAY_SELECTORS = (
+    "div[class*='days-wrapper'] span[class*='day'][class*='valid']",
+    "span[class*='day'][class*='valid']",
+    "div[class*='days-wrapper'] span[class*='day']",
+)
+_TIME_PICKER_CONTAINER_SELECTOR = (
+    "div[class*='tiktok-timepicker-time-picker-container']:not([class*='invisible'])"
+)
+# Drum cells for every hour and minute; TikTok may or may not zero-pad them
+_HOUR_XPATHS = {
+    h: "//span[contains(@class,'tiktok-timepicker-left')"
+    f" and (normalize-space(text())='{h}' or normalize-space(text())='{h:02d}')]"
+    for h in range(24)
+}
+_MINUTE_XPATHS = {
+    m: "//span[contains(@class,'tiktok-timepicker-right')"
+    f" and (normalize-space(text())='{m:02d}' or normalize-space(text())='{m}')]"
+    for m in range(60)
+}
+
+# Product link selectors
+_PRODUCT_ADD_LINK_XPATH = (
+    "//button[contains(@class, 'Button__root') and contains(., 'Add')]"
+)
+_PRODUCT_NEXT_XPATH = (
+    "//button[contains(@class, 'TUXButton--primary') and .//div[text()='Next']]"
+)
+_PRODUCT_ADD_XPATH = (
+    "//button[contains(@class, 'TUXButton--primary') and .//div[text()='Add']]"
+)
+_PRODUCT_SEARCH_XPATH = "//input[@placeholder='Search products']"
+
+# Close (X) button of TikTok's "low quality" warning popup, scoped to a
+# dialog that mentions quality so other close buttons on the page never match
+_LOW_QUALITY_CLOSE_XPATH = (
+    "//div[@role='dialog' or contains(@class,'modal') or contains(@class,'dialog')]"
+    "[contains(translate(normalize-space(.),'QUALITY','quality'),'quality')]"
+    "//*[self::button or @data-e2e='close-btn']"
+    "[@aria-label='Close' or @data-e2e='close-btn' or contains(@aria-label,'lose')"
+    " or contains(@class,'close') or contains(@class,'dismiss')]"
+)
+
+# Clicks the 'Got it' / 'OK' (or any modal) button of TikTok's feature
+# announcement popup if one is rendered; returns whether it clicked. Never waits.
+_DISMISS_FEATURE_POPUP_JS = """
+() => {
+    const shown = el => el.getClientRects().length > 0;
+    const btn =
+        [...document.querySelectorAll("button")].find(
+            b => shown(b) && /^\\s*(got it|ok)\\s*$/i.test(b.textContent)
+        ) ||
+        [...document.querySelectorAll("div[class*='modal'] button")].find(shown);
+    if (!btn) return false;
+    btn.click();
+    return true;
+}
+"""
+
+# Lone surrogates cannot be encoded and are dropped from descriptions
+_SURROGATES_RE = re.compile("[\ud800-\udfff]")
+
+# Calendar header month names (e.g. "February") to month numbers
+_MONTH_NAME_TO_NUM = {name: i for i, name in enumerate(month_name) if name}
+
+# Each browser's IANA timezone, looked up once per page
+_BROWSER_TIMEZONES: "weakref.WeakKeyDictionary[Page, datetime.tzinfo]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Pages on which the cookie banner / feature popup were already dismissed;
+# neither comes back within the same browser session
+_COOKIES_DISMISSED: "weakref.WeakSet[Page]" = weakref.WeakSet()
+_FEATURE_POPUP_DISMISSED: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+# Authenticated pages kept warm between the wrapper functions' calls when
+# quit_on_end is off. Each thread has its own pool, as sync Playwright objects
+# can only be used from the thread that created them (a thread-local, since
+# thread idents are reused once a thread exits).
+_PAGE_POOL = threading.local()
+
 
 class TikTokUploader:
     def __init__(
@@ -129,32 +342,78 @@ class TikTokUploader:
         skip_split_window: bool = False,
         on_complete: Callable[[VideoDict], None] | None = None,
         *args,
+        max_concurrency: int = 1,
         **kwargs,
     ) -> list[VideoDict]:
         """
         Uploads multiple videos to TikTok.
         Returns a list of failed videos.
+
+        With `max_concurrency` > 1 the videos are split across that many
+        browsers which upload side by side; `on_complete` may then be called
+        from several threads.
         """
         videos = _convert_videos_dict(videos)  # type: ignore
 
         if videos and len(videos) > 1:
             logger.debug("Uploading %d videos", len(videos))
 
+        prepared, failed = _prepare_batch(videos)
+        if not prepared:
+            return failed
+
+        if max_concurrency > 1 and len(prepared) > 1:
+            failed += self._upload_videos_concurrently(
+                prepared,
+                max_concurrency,
+                num_retries,
+                skip_split_window,
+                on_complete,
+                *args,
+                **kwargs,
+            )
+        else:
+            failed += self._upload_prepared(
+                prepared,
+                num_retries,
+                skip_split_window,
+                on_complete,
+                *args,
+                **kwargs,
+            )
+        return failed
+
+    def _upload_prepared(
+        self,
+        prepared: list["_PreparedVideo"],
+        num_retries: int,
+        skip_split_window: bool,
+        on_complete: Callable[[VideoDict], None] | None,
+        *args,
+        **kwargs,
+    ) -> list[VideoDict]:
+        """
+        Uploads videos already validated by `_prepare_batch` in this
+        uploader's browser. Returns a list of failed videos.
+        """
         page = self.page  # Triggers lazy loading/authentication
 
         failed = []
         # uploads each video
-        for video in videos:
+        for video, path, cover_path, schedule in prepared:
+            # The batch was validated up front; a slot may have gone stale
+            # while earlier videos were uploading
+            if schedule is not None and not _check_valid_schedule(schedule):
+                print(
+                    f"{schedule} is no longer at least 20 minutes in the future, skipping"
+                )
+                failed.append(video)
+                continue
+
             try:
-                path = abspath(video.get("path", "."))
                 description = video.get("description", "")
-                schedule = video.get("schedule", None)
                 product_id = video.get("product_id", None)
-                cover_path = video.get("cover", None)
                 sound = video.get("sound", None)
-                if cover_path is not None:
-                    cover_path = abspath(cover_path)
-
                 visibility = video.get("visibility", "everyone")
 
                 logger.debug(
@@ -167,39 +426,6 @@ class TikTokUploader:
                     ),
                 )
 
-                # Video must be of supported type
-                if not _check_valid_path(path):
-                    print(f"{path} is invalid, skipping")
-                    failed.append(video)
-                    continue
-
-                # Video must have a valid datetime for tiktok's scheduler
-                if schedule:
-                    timezone = pytz.UTC
-                    if schedule.tzinfo is None:
-                        schedule = schedule.astimezone(timezone)
-                    elif (utc_offset := schedule.utcoffset()) is not None and int(
-                        utc_offset.total_seconds()
-                    ) == 0:  # Equivalent to UTC
-                        schedule = timezone.localize(schedule)
-                    else:
-                        print(
-                            f"{schedule} is invalid, the schedule datetime must be naive or aware with UTC timezone, skipping"
-                        )
-                        failed.append(video)
-                        continue
-
-                    valid_tiktok_minute_multiple = 5
-                    schedule = _get_valid_schedule_minute(
-                        schedule, valid_tiktok_minute_multiple
-                    )
-                    if not _check_valid_schedule(schedule):
-                        print(
-                            f"{schedule} is invalid, the schedule datetime must be as least 20 minutes in the future, and a maximum of 10 days, skipping"
-                        )
-                        failed.append(video)
-                        continue
-
                 complete_upload_form(
                     page,
                     path,
@@ -229,13 +455,82 @@ class TikTokUploader:
 
         return failed
 
+    def _upload_videos_concurrently(
+        self,
+        videos: list["_PreparedVideo"],
+        max_concurrency: int,
+        num_retries: int,
+        skip_split_window: bool,
+        on_complete: Callable[[VideoDict], None] | None,
+        *args,
+        **kwargs,
+    ) -> list[VideoDict]:
+        """
+        Uploads `videos` from up to `max_concurrency` worker threads.
+
+        Playwright's sync API is bound to the thread that started it, so each
+        worker drives its own browser through a copy of this uploader (same
+        auth, proxy and browser settings). Most of an upload is spent waiting
+        on TikTok, so the workers' waits overlap.
+        """
+        n_workers = min(max_concurrency, len(videos))
+        batches = [videos[i::n_workers] for i in range(n_workers)]
+        logger.debug("Uploading with %d concurrent browsers", n_workers)
+
+        def run_batch(batch: list[_PreparedVideo]) -> list[VideoDict]:
+            worker = copy.copy(self)
+            worker._page = None
+            try:
+                return worker._upload_prepared(
+                    batch,
+                    num_retries,
+                    skip_split_window,
+                    on_complete,
+                    *args,
+                    **kwargs,
+                )
+            finally:
+                worker.close()
+
+        failed: list[VideoDict] = []
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            for batch_failed in pool.map(run_batch, batches):
+                failed.extend(batch_failed)
+        return failed
+
+    def _pool_key(self) -> tuple:
+        """Identifies the thread, browser and account a pooled page serves"""
+        return (
+            self.browser_name,
+            self.headless,
+            repr(self.proxy),
+            self.auth.username,
+            self.auth.cookies_path,
+            self.auth.cookies_str,
+            self.auth.sessionid,
+            repr(self.auth.cookies_list),
+        )
+
+    def _checkout_pooled_page(self) -> None:
+        """Adopts a warm, already authenticated page from the pool if one is open"""
+        page = _page_pool().pop(self._pool_key(), None)
+        if page is None:
+            return
+        if page.is_closed():
+            _close_quietly(page)
+        else:
+            self._page = page
+
+    def _release_to_pool(self) -> None:
+        """Parks the page in the pool for the next call instead of closing it"""
+        if self._page is not None:
+            _page_pool()[self._pool_key()] = self._page
+            self._page = None
+
     def close(self):
         """Closes the browser instance."""
         if self._page:
-            try:
-                self._page.context.browser.close()
-            except Exception as e:
-                logger.debug(f"Error closing browser: {e}")
+            _close_quietly(self._page)
             self._page = None
 
     def __enter__(self):
@@ -245,6 +540,34 @@ class TikTokUploader:
         self.close()
 
 
+def _page_pool() -> dict[tuple, Page]:
+    """The calling thread's pool of warm pages"""
+    pages = getattr(_PAGE_POOL, "pages", None)
+    if pages is None:
+        pages = _PAGE_POOL.pages = {}
+    return pages
+
+
+def _close_quietly(page: Page) -> None:
+    try:
+        close_browser(page)
+    except Exception as e:
+        logger.debug(f"Error closing browser: {e}")
+
+
+def close_pool() -> None:
+    """
+    Closes the browsers parked in the calling thread's page pool. Runs at exit
+    for the main thread; other threads should call it before they finish.
+    """
+    pages = _page_pool()
+    while pages:
+        _close_quietly(pages.popitem()[1])
+
+
+atexit.register(close_pool)
+
+
 # Wrapper functions for backward compatibility (optional but good for transition)
 def upload_video(
     filename: str,
@@ -296,11 +619,14 @@ def upload_video(
     if cover:
         video_dict["cover"] = cover
 
+    uploader._checkout_pooled_page()
     try:
         return uploader.upload_videos([video_dict], *args, **kwargs)
     finally:
         if config.quit_on_end:
             uploader.close()
+        else:
+            uploader._release_to_pool()
 
 
 def upload_videos(
@@ -318,6 +644,7 @@ def upload_videos(
     ) = None,  # Not fully supported in new class-based approach as constructor
     headless: bool = False,
     *args,
+    max_concurrency: int = 1,
     **kwargs,
 ) -> list[VideoDict]:
     """
@@ -339,12 +666,18 @@ def upload_videos(
 
     if browser_agent:
         uploader._page = uploader.auth.authenticate_agent(browser_agent)
+    else:
+        uploader._checkout_pooled_page()
 
     try:
-        return uploader.upload_videos(videos, *args, **kwargs)
+        return uploader.upload_videos(
+            videos, *args, max_concurrency=max_concurrency, **kwargs
+        )
     finally:
         if config.quit_on_end:
             uploader.close()
+        elif not browser_agent:
+            uploader._release_to_pool()
 
 
 def complete_upload_form(
@@ -369,8 +702,16 @@ def complete_upload_form(
     _remove_cookies_window(page)
     _dismiss_feature_popup(page)
 
-    _set_video(page, path=path, num_retries=num_retries, **kwargs)
-    _dismiss_feature_popup(page)  # may appear again after video processes
+    # The caption editor is usable while TikTok is still processing the
+    # video, so the description is typed during that wait instead of after it
+    _set_video(
+        page,
+        path=path,
+        num_retries=num_retries,
+        while_processing=lambda: _set_description(page, description),
+        **kwargs,
+    )
+    _dismiss_feature_popup(page, recheck=True)  # may appear again after processing
 
     if sound:
         _set_sound(page, sound)
@@ -379,7 +720,6 @@ def complete_upload_form(
     if not skip_split_window:
         _remove_split_window(page)
     _set_interactivity(page, **kwargs)
-    _set_description(page, description)
     if visibility != "everyone":
         _set_visibility(page, visibility)
     if schedule:
@@ -416,39 +756,43 @@ def _set_description(page: Page, description: str) -> None:
 
     logger.debug(green("Setting description"))
 
-    # Remove any characters outside the BMP range (emojis, etc) & Fix accents
-    description = description.encode("utf-8", "ignore").decode("utf-8")
+    # Remove characters which cannot be encoded (lone surrogates) in one pass
+    description = _SURROGATES_RE.sub("", description)
     saved_description = description
 
     try:
         desc_locator = page.locator(f"xpath={config.selectors.upload.description}")
         desc_locator.wait_for(state="visible", timeout=config.implicit_wait * 1000)
 
+        _clear(desc_locator)
         desc_locator.click()
 
-        # Select all existing text and delete it.
-        # On macOS, Ctrl+A moves cursor to line start; Meta+A (Cmd+A) selects all.
-        desc_locator.press("Meta+A")
-        desc_locator.press("Backspace")
-        # Belt-and-suspenders: repeat with Ctrl+A for Linux/Windows compatibility
-        desc_locator.press("Control+A")
-        desc_locator.press("Backspace")
+        # Consecutive plain words are inserted in one go (a single insertText,
+        # not a key event per character); only hashtags and mentions are
+        # typed key by key, as that is what triggers TikTok's autocomplete
+        plain_words: list[str] = []
 
-        desc_locator.click()
-        time.sleep(1)
+        def type_plain_words() -> None:
+            if plain_words:
+                page.keyboard.insert_text(" ".join(plain_words) + " ")
+                plain_words.clear()
 
-        words = description.split(" ")
-        for word in words:
+        for word in description.split(" "):
+            if not word.startswith(("#", "@")):
+                plain_words.append(word)
+                continue
+
+            type_plain_words()
             if word[0] == "#":
                 desc_locator.press_sequentially(word, delay=50)
-                time.sleep(0.5)
 
-                mention_box = page.locator(
-                    f"xpath={config.selectors.upload.mention_box}"
-                )
+                # The popover is already open for the typed prefix; only pick
+                # a suggestion once it has caught up with the whole tag
                 try:
-                    mention_box.wait_for(
-                        state="visible", timeout=config.add_hashtag_wait * 1000
+                    page.wait_for_function(
+                        _HASHTAG_SUGGESTED_JS,
+                        arg=[config.selectors.upload.mention_box, word[1:]],
+                        timeout=config.add_hashtag_wait * 1000,
                     )
                     desc_locator.press("Enter")
                 except Exception:
@@ -457,29 +801,37 @@ def _set_description(page: Page, description: str) -> None:
             elif word[0] == "@":
                 logger.debug(green("- Adding Mention: " + word))
                 desc_locator.press_sequentially(word)
-                time.sleep(1)
 
                 mention_box_user_id = page.locator(
                     f"xpath={config.selectors.upload.mention_box_user_id}"
                 )
                 try:
                     mention_box_user_id.first.wait_for(state="visible", timeout=5000)
+                    # Suggestions for the typed prefix show first; give the
+                    # list time to catch up with the whole username
+                    try:
+                        page.wait_for_function(
+                            _MENTION_SUGGESTED_JS,
+                            arg=[config.selectors.upload.mention_box_user_id, word[1:]],
+                            timeout=3000,
+                        )
+                    except PlaywrightTimeoutError:
+                        pass
 
                     found = False
-                    user_ids = mention_box_user_id.all()
+                    # One round-trip for every suggestion's user id (None if hidden)
+                    user_ids = mention_box_user_id.evaluate_all(_MENTION_USER_IDS_JS)
 
                     target_username = word[1:].lower()
 
-                    for i, user_el in enumerate(user_ids):
-                        if user_el.is_visible():
-                            text = user_el.inner_text().split(" ")[0]
-                            if text.lower() == target_username:
-                                found = True
-                                print("Matching User found : Clicking User")
-                                for _ in range(i):
-                                    desc_locator.press("ArrowDown")
-                                desc_locator.press("Enter")
-                                break
+                    for i, user_id in enumerate(user_ids):
+                        if user_id is not None and user_id.lower() == target_username:
+                            found = True
+                            print("Matching User found : Clicking User")
+                            for _ in range(i):
+                                desc_locator.press("ArrowDown")
+                            desc_locator.press("Enter")
+                            break
 
                     if not found:
                         desc_locator.press_sequentially(" ")
@@ -487,13 +839,11 @@ def _set_description(page: Page, description: str) -> None:
                 except Exception:
                     desc_locator.press_sequentially(" ")
 
-            else:
-                desc_locator.press_sequentially(word + " ")
+        type_plain_words()
 
     except Exception as exception:
         print("Failed to set description: ", exception)
-        # fallback
-        _clear(desc_locator)
+        # fallback (fill replaces whatever was typed so far)
         desc_locator.fill(saved_description)
 
 
@@ -501,21 +851,76 @@ def _clear(locator) -> None:
     """
     Clears the text of the element
     """
-    locator.press("Control+A")
-    locator.press("Backspace")
+    # fill selects all and replaces in one call, on every platform
+    locator.fill("")
 
 
-def _set_video(page: Page, path: str = "", num_retries: int = 3, **kwargs) -> None:
+def _wait_for(locator, state: str = "visible", timeout: float = 5000) -> bool:
+    """
+    Waits for the locator to reach the given state, returning whether it did
+    """
+    try:
+        locator.wait_for(state=state, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def _xpath_literal(value: str) -> str:
+    """
+    Quotes `value` as an XPath string literal, using concat() when it
+    contains both kinds of quote
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ', "\'", '.join(f"'{part}'" for part in parts) + ")"
+
+
+def _first_visible(page: Page, xpaths: tuple[str, ...]) -> Locator | None:
+    """
+    Resolves a cascade of candidate XPaths in one round-trip, returning a
+    locator for the first one that is rendered (or None if none are)
+    """
+    index = page.evaluate(_FIRST_VISIBLE_JS, list(xpaths))
+    if index < 0:
+        return None
+    return page.locator(f"xpath={xpaths[index]}").first
+
+
+def _set_video(
+    page: Page,
+    path: str = "",
+    num_retries: int = 3,
+    while_processing: Callable[[], None] | None = None,
+    **kwargs,
+) -> None:
     """
     Sets the video to upload
+
+    `while_processing` is called once, after the file has been handed to
+    TikTok and before waiting for it to finish processing. Errors from it
+    are raised as FailedToSetDescription rather than retrying the upload
     """
     logger.debug(green("Uploading video file"))
 
     for _ in range(num_retries):
         try:
             upload_box = page.locator(f"xpath={config.selectors.upload.upload_video}")
+            # Pass the path, never a buffer: with a local browser Playwright
+            # only hands the path over and Chromium reads the file from disk
             upload_box.set_input_files(path)
 
+            if while_processing is not None:
+                callback, while_processing = while_processing, None
+                try:
+                    callback()
+                except Exception as exception:
+                    logger.error(red(f"Failed to set description: {exception}"))
+                    raise FailedToSetDescription(exception) from exception
+
             # wait until a non-draggable image is found (process confirmation)
             process_confirmation = page.locator(
                 f"xpath={config.selectors.upload.process_confirmation}"
@@ -524,6 +929,8 @@ def _set_video(page: Page, path: str = "", num_retries: int = 3, **kwargs) -> No
                 state="attached", timeout=config.explicit_wait * 1000
             )
             return
+        except FailedToSetDescription:
+            raise
         except PlaywrightTimeoutError as exception:
             print("TimeoutException occurred:\n", exception)
         except Exception as exception:
@@ -531,20 +938,21 @@ def _set_video(page: Page, path: str = "", num_retries: int = 3, **kwargs) -> No
             raise FailedToUpload(exception)
 
 
-def _dismiss_feature_popup(page: Page) -> None:
+def _dismiss_feature_popup(page: Page, recheck: bool = False) -> None:
     """
     Dismisses TikTok's 'New editing features added' (or similar) modal
     by clicking any 'Got it' / 'OK' / 'Close' button that appears.
+
+    Skipped once the popup was dismissed on this page, unless `recheck`
     """
+    if page in _FEATURE_POPUP_DISMISSED and not recheck:
+        return
+
     try:
-        # Match button by visible text — covers 'Got it', 'Got It', etc.
-        btn = page.locator(
-            "//button[contains(translate(., 'GOTIQUK', 'gotiquk'), 'got it')]"
-            " | //button[contains(translate(., 'GOTIQUK', 'gotiquk'), 'ok')]"
-            " | //div[contains(@class,'modal')]//button"
-        ).first
-        if btn.is_visible(timeout=4000):
-            btn.click()
+        # Looks the button up and clicks it in one round-trip; when there is
+        # no popup this is a single DOM query rather than a locator probe
+        if page.evaluate(_DISMISS_FEATURE_POPUP_JS):
+            _FEATURE_POPUP_DISMISSED.add(page)
             logger.debug(green("Dismissed feature popup"))
     except Exception:
         pass
@@ -564,45 +972,16 @@ def _set_sound(page: Page, sound: str) -> None:
     logger.debug(green(f"Adding sound: {sound}"))
     try:
         # ── Step 1: Click 'Sounds' in the editor toolbar ──────────────────
-        sounds_btn = None
-        for sel in [
-            "xpath=//button[normalize-space()='Sounds']",
-            "xpath=//button[.//span[normalize-space()='Sounds']]",
-            "xpath=//div[@role='button' and normalize-space()='Sounds']",
-            "xpath=//*[normalize-space()='Sounds' and (self::button or @role='button')]",
-            "xpath=//span[normalize-space()='Sounds']/ancestor::button[1]",
-            "xpath=//span[normalize-space()='Sounds']/ancestor::div[@role='button'][1]",
-        ]:
-            try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=3000):
-                    sounds_btn = el
-                    break
-            except Exception:
-                continue
-
-        if sounds_btn is None:
+        sounds_btn = page.get_by_role("button", name="Sounds", exact=True).first
+        if not _wait_for(sounds_btn, timeout=3000):
             logger.warning("Sounds button not found — skipping sound")
             return
 
         sounds_btn.click()
-        time.sleep(1.5)
 
         # ── Step 2: Search for the song ────────────────────────────────────
-        search_box = None
-        for sel in [
-            "xpath=//input[contains(@placeholder,'Search sounds') or contains(@placeholder,'search sounds')]",
-            "xpath=//input[contains(@placeholder,'Search') and ancestor::*[contains(@class,'sound') or contains(@class,'Sound')]]",
-        ]:
-            try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=6000):
-                    search_box = el
-                    break
-            except Exception:
-                continue
-
-        if search_box is None:
+        search_box = page.locator(", ".join(_SOUND_SEARCH_SELECTORS)).first
+        if not _wait_for(search_box, timeout=6000):
             logger.warning("Sound search box not found — skipping sound")
             try:
                 page.keyboard.press("Escape")
@@ -612,36 +991,31 @@ def _set_sound(page: Page, sound: str) -> None:
 
         search_box.click()
         search_box.fill(sound)
-        time.sleep(0.5)
         page.keyboard.press("Enter")
-        time.sleep(3)  # wait for results to load
 
         # ── Step 3: Click '+' on the first search result ───────────────────
-        # Wait a bit longer to ensure results have fully rendered
-        time.sleep(2)
+        # Wait until at least one result row with a button has rendered
+        try:
+            page.wait_for_function(
+                "() => document.querySelector("
+                "\"li button, [role='listitem'] button, [role='option'] button\")",
+                timeout=5000,
+            )
+        except PlaywrightTimeoutError:
+            pass
 
+        # Candidates are tried in priority order; a union would pick whichever
+        # matches first in the DOM, e.g. an unrelated list button
+        panel = page.locator(_SOUND_PANEL_SELECTOR).first
+        scope = panel if panel.count() else page
         add_btn = None
-        for sel in [
-            # Explicit aria-label Add button
-            "xpath=(//button[@aria-label='Add' or @aria-label='add'])[1]",
-            # Button containing only a '+' character
-            "xpath=(//button[normalize-space(.)='+'])[1]",
-            # Button with title 'Add'
-            "xpath=(//button[@title='Add' or @title='add'])[1]",
-            # Any list item's last button (the + circle at right of row)
-            "xpath=(//li[.//button])[1]//button[last()]",
-            # Any div-row's last button
-            "xpath=(//div[@role='listitem' or @role='option'][.//button])[1]//button[last()]",
-            # SVG button that is NOT the search/clear/close/back button
-            "xpath=(//button[.//svg][not(contains(@class,'close'))][not(contains(@class,'clear'))][not(contains(@class,'back'))][not(contains(@class,'search'))])[last()]",
-        ]:
-            try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=2000):
-                    add_btn = el
-                    break
-            except Exception:
-                continue
+        for candidate in (
+            page.get_by_role("button", name=_SOUND_ADD_NAME_RE),
+            *(scope.locator(sel) for sel in _SOUND_ADD_SELECTORS),
+        ):
+            if candidate.first.is_visible():
+                add_btn = candidate.first
+                break
 
         if add_btn is None:
             logger.warning(f"No sound results found for '{sound}' — skipping")
@@ -652,54 +1026,48 @@ def _set_sound(page: Page, sound: str) -> None:
             return
 
         add_btn.click()
-        time.sleep(1.5)
+
+        # The song's track appears in the timeline once it has been added
+        sound_word = _xpath_literal((sound or "").split()[0])
+        track_xpath = (
+            "//div[contains(@class,'track') or contains(@class,'Track') or "
+            "contains(@class,'audio') or contains(@class,'Audio')]"
+            f"[.//*[contains(text(),{sound_word})]]"
+        )
+        try:
+            _wait_for(page.locator(f"xpath=({track_xpath})[1]"), state="attached")
+        except Exception as exc:
+            logger.debug(f"Could not wait for the sound track: {exc}")
 
         # ── Step 4: Close the Sounds panel ────────────────────────────────
         # Clicking + does NOT always close the panel. Close it explicitly so
         # the panel buttons don't interfere with the speaker button search.
         try:
             # The panel header has an × button; try several selectors.
-            closed = False
-            for close_sel in [
-                "xpath=//div[contains(@class,'SoundPanel') or contains(@class,'Sounds')]//button[@aria-label='Close' or @aria-label='close' or @title='Close']",
-                "xpath=//div[contains(text(),'Sounds')]/following-sibling::button",
-                "xpath=//div[@class[contains(.,'sound') or contains(.,'Sound')]]//button[.//svg][1]",
-            ]:
-                try:
-                    el = page.locator(close_sel).first
-                    if el.is_visible(timeout=1000):
-                        el.click()
-                        closed = True
-                        break
-                except Exception:
-                    continue
-            if not closed:
+            close_btn = _first_visible(page, _SOUND_PANEL_CLOSE_XPATHS)
+            if close_btn is not None:
+                close_btn.click()
+            else:
                 page.keyboard.press("Escape")
-            time.sleep(1)
+            _wait_for(search_box, state="hidden", timeout=2000)
         except Exception:
             pass
 
         # ── Step 5: Click song track → set volume to -60 dB (silent) ─────────
         try:
             # Click the audio track bar to select it and open the Audio panel.
-            sound_word = (sound or "").split()[0]
-            selected = False
-            for sel in [
-                f"xpath=(//div[contains(@class,'track') or contains(@class,'Track') or contains(@class,'audio') or contains(@class,'Audio')][.//*[contains(text(),'{sound_word}')]])[1]",
-                f"xpath=(//*[contains(text(),'{sound_word}') and not(ancestor::*[contains(@class,'SoundPanel') or contains(@class,'search') or contains(@class,'list')])])[last()]",
-            ]:
-                try:
-                    el = page.locator(sel).first
-                    if el.is_visible(timeout=1500):
-                        el.dispatch_event("click")
-                        selected = True
-                        break
-                except Exception:
-                    continue
-            if not selected:
+            track = _first_visible(
+                page,
+                (
+                    f"({track_xpath})[1]",
+                    f"(//*[contains(text(),{sound_word}) and not(ancestor::*[contains(@class,'SoundPanel') or contains(@class,'search') or contains(@class,'list')])])[last()]",
+                ),
+            )
+            if track is not None:
+                track.dispatch_event("click")
+            else:
                 vp = page.viewport_size or {"width": 1280, "height": 720}
                 page.mouse.click(int(vp["width"] * 0.5), int(vp["height"] * 0.91))
-            time.sleep(1.5)
 
             # The Volume input has class PropSettingInput__input; the topmost
             # visible one (lowest y) is Volume, the others are Fade in/out.
@@ -709,32 +1077,27 @@ def _set_sound(page: Page, sound: str) -> None:
             page.keyboard.press("ControlOrMeta+A")
             page.keyboard.type("-60")
             page.keyboard.press("Enter")
-            time.sleep(0.4)
+            try:
+                page.wait_for_function(
+                    "() => document.querySelector('input.PropSettingInput__input')"
+                    "?.value.startsWith('-60')",
+                    timeout=2000,
+                )
+            except PlaywrightTimeoutError:
+                pass
             logger.debug(green("Song track volume set to -60 dB (silent)"))
         except Exception as mute_exc:
             logger.warning(f"Could not silence song track: {mute_exc}")
 
         # ── Step 5: Click Save ─────────────────────────────────────────────
         # Save exits the editor and returns to the main upload form.
-        save_btn = None
-        for sel in [
-            "xpath=//button[normalize-space()='Save']",
-            "xpath=//button[.//span[normalize-space()='Save']]",
-        ]:
-            try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=5000):
-                    save_btn = el
-                    break
-            except Exception:
-                continue
-
-        if save_btn is None:
+        save_btn = page.get_by_role("button", name="Save", exact=True).first
+        if not _wait_for(save_btn):
             logger.warning("Save button not found — sound added but not saved")
             return
 
         save_btn.click()
-        time.sleep(2)
+        _wait_for(save_btn, state="hidden", timeout=config.explicit_wait * 1000)
 
         logger.debug(green(f"Sound set and saved: {sound}"))
     except Exception as exc:
@@ -747,6 +1110,9 @@ def _remove_cookies_window(page: Page) -> None:
     """
     Removes the cookies window if it is open
     """
+    if page in _COOKIES_DISMISSED:
+        return
+
     logger.debug(green("Removing cookies window"))
 
     try:
@@ -755,8 +1121,11 @@ def _remove_cookies_window(page: Page) -> None:
         button = page.locator(selector).first
         if button.is_visible(timeout=5000):
             button.click()
+            _COOKIES_DISMISSED.add(page)
 
     except Exception:
+        # Only removes the node; the banner returns on the next page load, so
+        # the page is not marked as dismissed
         page.evaluate(
             f"""
             const banner = document.querySelector("{config.selectors.upload.cookies_banner.banner}");
@@ -794,18 +1163,20 @@ def _set_interactivity(
     try:
         logger.debug(green("Setting interactivity settings"))
 
-        comment_box = page.locator(f"xpath={config.selectors.upload.comment}")
-        stitch_box = page.locator(f"xpath={config.selectors.upload.stitch}")
-        duet_box = page.locator(f"xpath={config.selectors.upload.duet}")
-
-        if comment ^ comment_box.is_checked():
-            comment_box.click()
+        xpaths = [
+            config.selectors.upload.comment,
+            config.selectors.upload.stitch,
+            config.selectors.upload.duet,
+        ]
+        boxes = [page.locator(f"xpath={xpath}") for xpath in xpaths]
 
-        if stitch ^ stitch_box.is_checked():
-            stitch_box.click()
+        # wait for the section once, then read all three states in one call
+        boxes[0].wait_for(state="attached")
+        checked = page.evaluate(_CHECKED_STATES_JS, xpaths)
 
-        if duet ^ duet_box.is_checked():
-            duet_box.click()
+        for wanted, box, is_checked in zip((comment, stitch, duet), boxes, checked):
+            if is_checked is not None and wanted ^ is_checked:
+                box.click()
 
     except Exception as _:
         logger.error("Failed to set interactivity settings")
@@ -820,12 +1191,9 @@ def _set_visibility(
     try:
         logger.debug(green(f"Setting visibility to: {visibility}"))
 
-        dropdown_xpath = (
-            "//div[@data-e2e='video_visibility_container']//button[@role='combobox']"
-        )
-        dropdown = page.locator(f"xpath={dropdown_xpath}")
+        dropdown = page.locator(_VISIBILITY_DROPDOWN_SELECTOR)
         dropdown.click()
-        time.sleep(1.5)
+        page.locator("div[role='option']").first.wait_for(state="visible")
 
         visibility_text_map = {
             "everyone": "Everyone",
@@ -834,11 +1202,8 @@ def _set_visibility(
         }
 
         option_text = visibility_text_map.get(visibility, "Everyone")
-        option_xpath = f"//div[@role='option' and contains(., '{option_text}')]"
-
-        option = page.locator(f"xpath={option_xpath}")
+        option = page.locator(f"div[role='option']:has-text('{option_text}')")
         option.scroll_into_view_if_needed()
-        time.sleep(0.5)
         option.click()
 
         logger.debug(green(f"Successfully set visibility to: {visibility}"))
@@ -853,10 +1218,7 @@ def _set_schedule_video(page: Page, schedule: datetime.datetime) -> None:
     """
     logger.debug(green("Setting schedule"))
 
-    timezone_str = page.evaluate("Intl.DateTimeFormat().resolvedOptions().timeZone")
-    driver_timezone = pytz.timezone(timezone_str)
-
-    schedule = schedule.astimezone(driver_timezone)
+    schedule = schedule.astimezone(_browser_timezone(page))
 
     month = schedule.month
     day = schedule.day
@@ -866,76 +1228,52 @@ def _set_schedule_video(page: Page, schedule: datetime.datetime) -> None:
     try:
         # TikTok shows a "When to post" section with "Now" and "Schedule" radio buttons.
         # The radio <input> is visually hidden; we must click the visible label/span.
-        clicked = False
-        label_selectors = [
-            "label:has-text('Schedule')",
-            "xpath=//label[contains(normalize-space(.), 'Schedule')]",
-            "xpath=//span[normalize-space(text())='Schedule']",
-            "xpath=//div[normalize-space(text())='Schedule']",
-        ]
-        for sel in label_selectors:
-            try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=3000):
-                    el.click()
-                    clicked = True
-                    logger.debug(green("Clicked Schedule label"))
-                    break
-            except Exception:
-                continue
-
-        if not clicked:
-            # Fallback: force-click the hidden radio input
-            for sel in [
-                "xpath=//input[@type='radio'][2]",
-                "xpath=//label[contains(.,'Schedule')]/input",
-                "xpath=//*[@id='tux-1']",
-            ]:
+        # The union resolves in DOM order, so hidden matches are filtered out
+        # rather than letting one of them shadow a visible candidate
+        schedule_label = (
+            page.locator(f"xpath={_SCHEDULE_LABEL_XPATH}").filter(visible=True).first
+        )
+        if _wait_for(schedule_label, timeout=3000):
+            schedule_label.click()
+            logger.debug(green("Clicked Schedule label"))
+        else:
+            # Fallback: force-click the hidden radio input (attached, not visible)
+            for xpath in _SCHEDULE_RADIO_XPATHS:
+                radio = page.locator(f"xpath={xpath}").first
                 try:
-                    page.locator(sel).first.click(force=True)
-                    clicked = True
-                    logger.debug(green("Force-clicked Schedule radio input"))
-                    break
+                    if radio.count():
+                        radio.click(force=True, timeout=3000)
+                        logger.debug(green("Force-clicked Schedule radio input"))
+                        break
                 except Exception:
                     continue
+            else:
+                raise Exception("Could not find or click Schedule toggle")
 
-        if not clicked:
-            raise Exception("Could not find or click Schedule toggle")
-
-        time.sleep(1)  # wait for date/time pickers OR low-quality popup to appear
+        # wait for the date/time pickers (or the low-quality popup) to appear
+        picker_shown = _wait_for(
+            page.locator(_SCHEDULED_PICKER_SELECTOR).first,
+            timeout=3000,
+        )
 
-        # TikTok sometimes shows a "low quality" warning when Schedule is clicked.
+        # TikTok sometimes shows a "low quality" warning instead of the pickers.
         # Close it with X (do NOT click "Replace Video"), then re-click Schedule.
         low_quality_dismissed = False
-        try:
-            close_btn = page.locator(
-                "xpath=//div[contains(@class,'modal') or contains(@class,'dialog') or contains(@class,'popup')]"
-                "//button[@aria-label='Close' or contains(@class,'close') or contains(@class,'dismiss')]"
-                " | xpath=//*[@data-e2e='close-btn']"
-                " | xpath=//button[contains(@aria-label,'lose')]"
-            ).first
-            if close_btn.is_visible(timeout=2000):
-                close_btn.click()
-                low_quality_dismissed = True
-                logger.debug(green("Dismissed low-quality warning popup"))
-                time.sleep(0.5)
-        except Exception:
-            pass
+        if not picker_shown:
+            try:
+                close_btn = page.locator(f"xpath={_LOW_QUALITY_CLOSE_XPATH}").first
+                if close_btn.is_visible():
+                    close_btn.click()
+                    low_quality_dismissed = True
+                    logger.debug(green("Dismissed low-quality warning popup"))
+                    _wait_for(close_btn, state="hidden", timeout=2000)
+            except Exception:
+                pass
 
         # If we dismissed a popup, the Schedule radio may have been de-selected — re-click it.
-        if low_quality_dismissed:
-            for sel in label_selectors:
-                try:
-                    el = page.locator(sel).first
-                    if el.is_visible(timeout=3000):
-                        el.click()
-                        logger.debug(
-                            green("Re-clicked Schedule label after popup dismissal")
-                        )
-                        time.sleep(1)
-                        break
-                except Exception:
-                    continue
+        if low_quality_dismissed and _wait_for(schedule_label, timeout=3000):
+            schedule_label.click()
+            logger.debug(green("Re-clicked Schedule label after popup dismissal"))
 
         __date_picker(page, month, day)
         __time_picker(page, hour, minute)
@@ -945,216 +1283,137 @@ def _set_schedule_video(page: Page, schedule: datetime.datetime) -> None:
         raise FailedToUpload()
 
 
+def _browser_timezone(page: Page) -> datetime.tzinfo:
+    """
+    Gets the browser's timezone, asking the page only the first time
+    """
+    timezone = _BROWSER_TIMEZONES.get(page)
+    if timezone is None:
+        timezone_str = page.evaluate("Intl.DateTimeFormat().resolvedOptions().timeZone")
+        try:
+            timezone = ZoneInfo(timezone_str)
+        except ZoneInfoNotFoundError:
+            # no tz database (e.g. Windows without tzdata); the browser runs here
+            logger.warning(red(f"Unknown timezone {timezone_str}, using local time"))
+            timezone = datetime.datetime.now().astimezone().tzinfo or _UTC
+        _BROWSER_TIMEZONES[page] = timezone
+    return timezone
+
+
 def __date_picker(page: Page, month: int, day: int) -> None:
     logger.debug(green("Picking date"))
 
-    # The date input is inside div.scheduled-picker and has a value like "2026-02-26"
-    date_input = page.locator(
-        "xpath=//div[contains(@class,'scheduled-picker')]//input[contains(@value,'-')]"
-    ).first
+    date_input = page.locator(_DATE_INPUT_SELECTOR).first
     date_input.wait_for(state="visible", timeout=5000)
     date_input.click()
-    time.sleep(0.5)
 
     # Wait for the calendar to be injected into the DOM
-    calendar = None
-    for sel in [
-        "xpath=//div[contains(@class,'calendar-wrapper')]",
-        "xpath=//div[contains(@class,'calendar')]",
-    ]:
-        try:
-            el = page.locator(sel).first
-            el.wait_for(state="visible", timeout=5000)
-            calendar = el
-            break
-        except Exception:
-            continue
-
-    if calendar is None:
+    calendar = page.locator(_CALENDAR_SELECTOR).first
+    if not _wait_for(calendar, timeout=5000):
         raise Exception("Calendar not found after clicking date input")
 
     # Read current month from calendar header (e.g. "February / 2026" or "February")
     n_calendar_month = month  # fallback: assume already correct
-    for sel in [
-        "xpath=//span[contains(@class,'month-title')]",
-        "xpath=//div[contains(@class,'month-title')]",
-    ]:
-        try:
-            el = page.locator(sel).first
-            if el.is_visible(timeout=2000):
-                text = el.inner_text().strip()
-                month_part = text.split("/")[0].split()[0].strip()
-                n_calendar_month = datetime.datetime.strptime(month_part, "%B").month
-                break
-        except Exception:
-            continue
+    try:
+        el = page.locator(_MONTH_TITLE_SELECTOR).first
+        if el.is_visible():
+            text = el.inner_text().strip()
+            month_part = text.split("/")[0].split()[0].strip()
+            n_calendar_month = _MONTH_NAME_TO_NUM.get(month_part, month)
+    except Exception:
+        pass
 
     if n_calendar_month != month:
         arrows = page.locator(f"xpath={config.selectors.schedule.calendar_arrows}")
+        first_day = page.locator(_DAY_SELECTORS[-1]).first
+        old_day = first_day.element_handle(timeout=2000) if first_day.count() else None
         if n_calendar_month < month:
             arrows.last.click()
         else:
             arrows.first.click()
-        time.sleep(0.5)
-
-    # Click the matching day cell
-    day_selectors = [
-        "xpath=//div[contains(@class,'days-wrapper')]//span[contains(@class,'day') and contains(@class,'valid')]",
-        "xpath=//span[contains(@class,'day') and contains(@class,'valid')]",
-        "xpath=//div[contains(@class,'days-wrapper')]//span[contains(@class,'day')]",
-    ]
-    valid_days = []
-    for sel in day_selectors:
-        try:
-            candidates = page.locator(sel).all()
-            if candidates:
-                valid_days = candidates
-                break
-        except Exception:
-            continue
+        # the day cells are re-rendered for the new month
+        if old_day is not None:
+            try:
+                page.wait_for_function(
+                    "el => !el.isConnected", arg=old_day, timeout=2000
+                )
+            except PlaywrightTimeoutError:
+                pass
 
-    day_to_click = None
-    for day_option in valid_days:
-        try:
-            if int(day_option.inner_text().strip()) == day:
-                day_to_click = day_option
-                break
-        except Exception:
-            continue
+    # Click the matching day cell, reading every cell's text in one call
+    for selector in _DAY_SELECTORS:
+        day_cells = page.locator(selector)
+        texts = day_cells.evaluate_all("els => els.map(e => e.textContent.trim())")
+        if texts:
+            break
 
-    if day_to_click:
-        day_to_click.click()
-    else:
+    matches = [i for i, text in enumerate(texts) if text.isdigit() and int(text) == day]
+    if not matches:
         raise Exception(f"Day {day} not found in calendar")
+    day_cells.nth(matches[0]).click()
 
     __verify_date_picked_is_correct(page, month, day)
 
 
 def __verify_date_picked_is_correct(page: Page, month: int, day: int) -> None:
-    # Read back the date input value (format: YYYY-MM-DD)
-    date_input = page.locator(
-        "xpath=//div[contains(@class,'scheduled-picker')]//input[contains(@value,'-')]"
-    ).first
-    date_selected = date_input.get_attribute("value") or ""
-    try:
-        date_selected_month = int(date_selected.split("-")[1])
-        date_selected_day = int(date_selected.split("-")[2])
-    except Exception:
-        logger.debug(green(f"Could not verify date — raw value: {date_selected!r}"))
-        return
+    # The date input reads YYYY-MM-DD once the picked day has been applied
+    date_input = page.locator(_DATE_INPUT_SELECTOR).first
+    expect(date_input).to_have_value(
+        re.compile(rf"-{month:02d}-{day:02d}$"), timeout=3000
+    )
+    logger.debug(green("Date picked correctly"))
 
-    if date_selected_month == month and date_selected_day == day:
-        logger.debug(green("Date picked correctly"))
-    else:
-        msg = f"Date picker mismatch: expected {month}-{day} but got {date_selected_month}-{date_selected_day}"
-        logger.error(msg)
-        raise Exception(msg)
+
+def _time_value_pattern(hour: int, minute: int) -> str:
+    """Regex for the time input's value; the hour may or may not be zero-padded"""
+    return rf"^0?{hour}:{minute:02d}$"
 
 
 def __time_picker(page: Page, hour: int, minute: int) -> None:
     logger.debug(green("Picking time"))
 
-    # The time input is inside div.scheduled-picker — value like "22:30" (no dash)
-    time_picker = page.locator(
-        "xpath=//div[contains(@class,'scheduled-picker')]//input[not(contains(@value,'-'))]"
-    ).first
+    time_picker = page.locator(_TIME_INPUT_SELECTOR).first
     if not time_picker.is_visible(timeout=5000):
         raise Exception("Time picker input not found")
 
     time_picker.click()
-    time.sleep(0.5)
 
     # Wait for the drum-roll container to appear
-    container_sel = (
-        "xpath=//div[contains(@class,'tiktok-timepicker-time-picker-container')"
-        " and not(contains(@class,'invisible'))]"
-    )
-    page.locator(container_sel).first.wait_for(state="visible", timeout=5000)
+    container = page.locator(_TIME_PICKER_CONTAINER_SELECTOR).first
+    container.wait_for(state="visible", timeout=5000)
 
-    # --- Hour: use direct XPath text match (handles both "9" and "09") ---
-    hour_xpath = (
-        f"xpath=//span[contains(@class,'tiktok-timepicker-left')"
-        f" and (normalize-space(text())='{hour}'"
-        f" or normalize-space(text())='{hour:02d}')]"
-    )
-    hour_el = page.locator(hour_xpath).first
+    hour_el = page.locator(f"xpath={_HOUR_XPATHS[hour]}").first
     hour_el.scroll_into_view_if_needed()
-    time.sleep(0.5)
     hour_el.click()
-    time.sleep(0.3)
 
-    # --- Minute: use direct XPath text match (always zero-padded: "00", "05" …) ---
-    minute_xpath = (
-        f"xpath=//span[contains(@class,'tiktok-timepicker-right')"
-        f" and (normalize-space(text())='{minute:02d}'"
-        f" or normalize-space(text())='{minute}')]"
-    )
-    minute_el = page.locator(minute_xpath).first
+    minute_el = page.locator(f"xpath={_MINUTE_XPATHS[minute]}").first
     minute_el.scroll_into_view_if_needed()
-    time.sleep(0.5)
     minute_el.click()
-    time.sleep(0.3)
+
+    # The input shows the picked time (H:MM or HH:MM) once both drums have settled
+    try:
+        page.wait_for_function(
+            "([el, pattern]) => new RegExp(pattern).test(el.value)",
+            arg=[time_picker.element_handle(), _time_value_pattern(hour, minute)],
+            timeout=3000,
+        )
+    except PlaywrightTimeoutError:
+        pass
 
     # Close the time picker
     time_picker.click()
-    time.sleep(0.5)
+    _wait_for(container, state="hidden", timeout=2000)
 
     __verify_time_picked_is_correct(page, hour, minute)
 
 
 def __verify_time_picked_is_correct(page: Page, hour: int, minute: int) -> None:
-    # Read back the time input value attribute (format: "HH:MM")
-    time_input = page.locator(
-        "xpath=//div[contains(@class,'scheduled-picker')]//input[not(contains(@value,'-'))]"
-    ).first
-    time_selected = time_input.get_attribute("value") or ""
-    try:
-        time_selected_hour = int(time_selected.split(":")[0])
-        time_selected_minute = int(time_selected.split(":")[1])
-    except Exception:
-        logger.debug(green(f"Could not verify time — raw value: {time_selected!r}"))
-        return
-
-    if time_selected_hour == hour and time_selected_minute == minute:
-        logger.debug(green("Time picked correctly"))
-    else:
-        msg = (
-            f"Time picker mismatch: expected {hour:02d}:{minute:02d} "
-            f"but got {time_selected_hour:02d}:{time_selected_minute:02d}"
-        )
-        raise Exception(msg)
-
-
-def _post_video(page: Page) -> None:
-    """
-    Posts the video
-    """
-    logger.debug(green("Clicking the post button"))
-
-    post_btn = page.locator(f"xpath={config.selectors.upload.post}")
-    try:
-
-        def is_enabled():
-            return post_btn.get_attribute("data-disabled") == "false"
-
-        for _ in range(int(config.uploading_wait / 2)):
-            if is_enabled():
-                break
-            time.sleep(2)
-
-        post_btn.scroll_into_view_if_needed()
-        post_btn.click()
-
-    except Exception:
-        logger.debug(green("Trying to click on the button again (fallback)"))
-        page.evaluate('document.querySelector(".TUXButton--primary").click()')
-
-    try:
-        post_now = page.locator(f"xpath={config.selectors.upload.post_now}")
-        if post_now.is_visible(timeout=5000):
-            post_now.click()
-    except Exception:
-        pass
+    # The time input reads HH:MM once both drums have settled
+    time_input = page.locator(_TIME_INPUT_SELECTOR).first
+    expect(time_input).to_have_value(
+        re.compile(_time_value_pattern(hour, minute)), timeout=3000
+    )
+    logger.debug(green("Time picked correctly"))
 
 
 def _post_video(page: Page) -> None:
@@ -1165,14 +1424,16 @@ def _post_video(page: Page) -> None:
 
     post_btn = page.locator(f"xpath={config.selectors.upload.post}")
     try:
-
-        def is_enabled():
-            return post_btn.get_attribute("data-disabled") == "false"
-
-        for _ in range(int(config.uploading_wait / 2)):
-            if is_enabled():
-                break
-            time.sleep(2)
+        # Checked inside the page on every animation frame, re-resolving the
+        # XPath each time in case TikTok re-renders the button
+        try:
+            page.wait_for_function(
+                _POST_ENABLED_JS,
+                arg=config.selectors.upload.post,
+                timeout=config.uploading_wait * 1000,
+            )
+        except PlaywrightTimeoutError:
+            pass
 
         post_btn.scroll_into_view_if_needed()
         post_btn.click()
@@ -1188,52 +1449,42 @@ def _post_video(page: Page) -> None:
     except Exception:
         pass
 
-    # Poll for success confirmation OR low-quality warning popup.
-    # If the popup appears, dismiss it with X and re-click Post.
+    # Wait for whichever comes first: the success confirmation or the
+    # low-quality warning popup. If the popup appears, dismiss it with X and
+    # re-click Post, then wait again.
     post_confirmation = page.locator(
         f"xpath={config.selectors.upload.post_confirmation}"
     )
-    low_quality_close = page.locator(
-        "xpath=//div[contains(@class,'modal') or contains(@class,'dialog') or contains(@class,'popup')]"
-        "//button[@aria-label='Close' or contains(@class,'close') or contains(@class,'dismiss')]"
-        " | xpath=//*[@data-e2e='close-btn']"
-        " | xpath=//button[contains(@aria-label,'lose')]"
-    )
+    low_quality_close = page.locator(f"xpath={_LOW_QUALITY_CLOSE_XPATH}").first
+    outcome = post_confirmation.or_(low_quality_close).first
+
+    deadline = time.monotonic() + config.explicit_wait
+    while (remaining := deadline - time.monotonic()) > 0:
+        if not _wait_for(outcome, timeout=remaining * 1000):
+            break
 
-    deadline = time.time() + config.explicit_wait
-    while time.time() < deadline:
         # Success?
-        try:
-            if post_confirmation.is_visible(timeout=1000):
-                logger.debug(green("Video posted successfully"))
-                return
-        except Exception:
-            pass
+        if post_confirmation.first.is_visible():
+            logger.debug(green("Video posted successfully"))
+            return
 
-        # Low-quality popup blocking the post?
+        # Low-quality popup blocking the post
         try:
-            if low_quality_close.first.is_visible(timeout=1000):
-                low_quality_close.first.click()
-                logger.debug(
-                    green(
-                        "Dismissed low-quality popup after Post click — retrying Post"
-                    )
-                )
-                time.sleep(0.5)
-                try:
-                    post_btn.click()
-                except Exception:
-                    try:
-                        page.evaluate(
-                            'document.querySelector(".TUXButton--primary").click()'
-                        )
-                    except Exception:
-                        pass
+            low_quality_close.click()
+            if not _wait_for(low_quality_close, state="hidden", timeout=2000):
+                # not a popup after all; only wait for the confirmation now
+                outcome = post_confirmation.first
+                continue
+            logger.debug(
+                green("Dismissed low-quality popup after Post click — retrying Post")
+            )
+            try:
+                post_btn.click()
+            except Exception:
+                page.evaluate('document.querySelector(".TUXButton--primary").click()')
         except Exception:
             pass
 
-        time.sleep(1)
-
     # Final check
     post_confirmation.wait_for(state="attached", timeout=5000)
     logger.debug(green("Video posted successfully"))
@@ -1245,42 +1496,31 @@ def _add_product_link(page: Page, product_id: str) -> None:
     """
     logger.debug(green(f"Attempting to add product link for ID: {product_id}..."))
     try:
-        add_link_button = page.locator(
-            "//button[contains(@class, 'Button__root') and contains(., 'Add')]"
-        )
+        add_link_button = page.locator(f"xpath={_PRODUCT_ADD_LINK_XPATH}")
         add_link_button.click()
-        time.sleep(1)
 
-        try:
-            first_next = page.locator(
-                "//button[contains(@class, 'TUXButton--primary') and .//div[text()='Next']]"
-            )
-            if first_next.is_visible(timeout=3000):
-                first_next.click()
-                time.sleep(1)
-        except Exception:
-            pass
+        # The modal opens either on an intro step with Next or on the search box
+        first_next = page.locator(f"xpath={_PRODUCT_NEXT_XPATH}")
+        search_input = page.locator(f"xpath={_PRODUCT_SEARCH_XPATH}")
+        _wait_for(first_next.or_(search_input).first, timeout=5000)
+        if first_next.is_visible():
+            first_next.click()
 
-        search_input = page.locator("//input[@placeholder='Search products']")
-        search_input.fill(product_id)
-        search_input.press("Enter")
-        time.sleep(3)
+        search_input.click()
+        page.keyboard.insert_text(product_id)
+        page.keyboard.press("Enter")
 
         product_radio = page.locator(
             f"//tr[.//span[contains(text(), '{product_id}')] or .//div[contains(text(), '{product_id}')]]//input[@type='radio' and contains(@class, 'TUXRadioStandalone-input')]"
-        )
+        ).first
+        product_radio.wait_for(state="visible", timeout=10000)
         product_radio.click()
-        time.sleep(1)
 
-        second_next = page.locator(
-            "//button[contains(@class, 'TUXButton--primary') and .//div[text()='Next']]"
-        )
+        # clicks wait for each button to become enabled
+        second_next = page.locator(f"xpath={_PRODUCT_NEXT_XPATH}")
         second_next.click()
-        time.sleep(1)
 
-        final_add = page.locator(
-            "//button[contains(@class, 'TUXButton--primary') and .//div[text()='Add']]"
-        )
+        final_add = page.locator(f"xpath={_PRODUCT_ADD_XPATH}")
         final_add.click()
 
         final_add.wait_for(state="hidden")
@@ -1321,13 +1561,15 @@ def _set_cover(page: Page, cover_path: str) -> None:
         )
         confirm_btn.click()
 
-        def check_src_change():
-            return preview_loc.get_attribute("src") != current_cover_src
-
-        for _ in range(20):
-            if check_src_change():
-                break
-            time.sleep(0.5)
+        # the preview is looked up by XPath on each check as it may re-render
+        try:
+            page.wait_for_function(
+                _COVER_CHANGED_JS,
+                arg=[config.selectors.upload.cover.cover_preview, current_cover_src],
+                timeout=10000,
+            )
+        except PlaywrightTimeoutError:
+            logger.debug(red("Cover preview did not change"))
 
     except Exception as e:
         logger.error(red(f"Error setting cover: {e}"))
@@ -1341,6 +1583,84 @@ def _set_cover(page: Page, cover_path: str) -> None:
             pass
 
 
+class _PreparedVideo(NamedTuple):
+    """A video whose paths and schedule have been validated and normalized"""
+
+    video: VideoDict
+    path: str
+    cover_path: str | None
+    schedule: datetime.datetime | None
+
+
+def _prepare_batch(
+    videos: list[VideoDict],
+) -> tuple[list[_PreparedVideo], list[VideoDict]]:
+    """
+    Resolves and validates every video's paths and schedule in one pass
+    before any browser work, so invalid videos fail early and the upload
+    loop only sees ready-to-post work. Returns (prepared, failed).
+    """
+    valid_paths: dict[str, bool] = {}  # duplicate paths are only checked once
+    now = datetime.datetime.now(_UTC)  # one clock read for the whole batch
+    prepared: list[_PreparedVideo] = []
+    failed: list[VideoDict] = []
+
+    for video in videos:
+        path = abspath(video.get("path", "."))
+        if path not in valid_paths:
+            valid_paths[path] = _check_valid_path(path)
+        # Video must be of supported type
+        if not valid_paths[path]:
+            print(f"{path} is invalid, skipping")
+            failed.append(video)
+            continue
+
+        cover_path = video.get("cover", None)
+        if cover_path is not None:
+            cover_path = abspath(cover_path)
+
+        # Video must have a valid datetime for tiktok's scheduler
+        schedule = video.get("schedule", None)
+        if schedule:
+            schedule = _prepare_schedule(schedule, now)
+            if schedule is None:
+                failed.append(video)
+                continue
+
+        prepared.append(_PreparedVideo(video, path, cover_path, schedule))
+
+    return prepared, failed
+
+
+def _prepare_schedule(
+    schedule: datetime.datetime, now: datetime.datetime | None = None
+) -> datetime.datetime | None:
+    """
+    Converts the schedule to UTC on TikTok's 5 minute grid, or returns None
+    (after reporting why) if TikTok's scheduler would not accept it
+    """
+    if schedule.tzinfo is None:
+        schedule = schedule.astimezone(_UTC)
+    elif (utc_offset := schedule.utcoffset()) is not None and int(
+        utc_offset.total_seconds()
+    ) == 0:  # Equivalent to UTC
+        schedule = schedule.replace(tzinfo=_UTC)
+    else:
+        print(
+            f"{schedule} is invalid, the schedule datetime must be naive or aware with UTC timezone, skipping"
+        )
+        return None
+
+    valid_tiktok_minute_multiple = 5
+    schedule = _get_valid_schedule_minute(schedule, valid_tiktok_minute_multiple)
+    if not _check_valid_schedule(schedule, now):
+        print(
+            f"{schedule} is invalid, the schedule datetime must be as least 20 minutes in the future, and a maximum of 10 days, skipping"
+        )
+        return None
+    return schedule
+
+
 def _check_valid_path(path: str) -> bool:
     return exists(path) and path.split(".")[-1] in config.supported_file_types
 
@@ -1375,10 +1695,12 @@ def _set_valid_schedule_minute(
     return schedule
 
 
-def _check_valid_schedule(schedule: datetime.datetime) -> bool:
+def _check_valid_schedule(
+    schedule: datetime.datetime, now: datetime.datetime | None = None
+) -> bool:
     valid_tiktok_minute_multiple = 5
     margin_to_complete_upload_form = 5
-    datetime_utc_now = pytz.UTC.localize(datetime.datetime.utcnow())
+    datetime_utc_now = now or datetime.datetime.now(_UTC)
     min_datetime_tiktok_valid = datetime_utc_now + datetime.timedelta(minutes=15)
     min_datetime_tiktok_valid += datetime.timedelta(
         minutes=margin_to_complete_upload_form
@@ -1404,37 +1726,43 @@ def _convert_videos_dict(
     correct_path = valid_path[0]
     correct_description = valid_description[0]
 
-    def intersection(lst1, lst2):
-        return list(set(lst1) & set(lst2))
+    path_keys = frozenset(valid_path)
+    description_keys = frozenset(valid_description)
 
     return_list: list[VideoDict] = []
     for elem in videos_list_of_dictionaries:
         elem = {k.strip().lower(): v for k, v in elem.items()}
-        keys = elem.keys()
-        path_intersection = intersection(valid_path, keys)
-        description_intersection = intersection(valid_description, keys)
 
-        if path_intersection:
-            path = elem[path_intersection.pop()]
+        path_key = next((k for k in elem if k in path_keys), None)
+        description_key = next((k for k in elem if k in description_keys), None)
+
+        if path_key is not None:
+            path = elem[path_key]
             if not _check_valid_path(path):
                 raise RuntimeError("Invalid path: " + path)
             elem[correct_path] = path
-        else:
-            for _, value in elem.items():
-                if _check_valid_path(value):
-                    elem[correct_path] = value
-                    break
-            else:
-                raise RuntimeError("Path not found in dictionary: " + str(elem))
 
-        if description_intersection:
-            elem[correct_description] = elem[description_intersection.pop()]
-        else:
-            for _, value in elem.items():
-                if not _check_valid_path(value):
-                    elem[correct_description] = value
+        if description_key is not None:
+            elem[correct_description] = elem[description_key]
+
+        if path_key is None or description_key is None:
+            # only sniff values when a key is missing, checking each one once
+            found_path = path_key is not None
+            found_description = description_key is not None
+            for value in list(elem.values()):
+                if found_path and found_description:
                     break
-            else:
+                if _check_valid_path(value):
+                    if not found_path:
+                        elem[correct_path] = value
+                        found_path = True
+                elif not found_description:
+                    elem[correct_description] = value
+                    found_description = True
+
+            if not found_path:
+                raise RuntimeError("Path not found in dictionary: " + str(elem))
+            if not found_description:
                 elem[correct_description] = ""
 
         return_list.append(elem)  # type: ignore
@@ -1450,3 +1778,8 @@ class DescriptionTooLong(Exception):
 class FailedToUpload(Exception):
     def __init__(self, message=None):
         super().__init__(message or self.__doc__)
+
+
+class FailedToSetDescription(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or self.__doc__)
@@ -2,11 +2,14 @@
 """
 Single-video upload test — uses the same 9AM-10PM slot logic as process_videos.py.
 Usage:  uv run python test_upload.py videos/YOUR_VIDEO.mp4 [--headless] [--debug]
+        uv run python test_upload.py --all [--concurrency N]  (every pending video)
 """
 import argparse
 import asyncio
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 
@@ -21,14 +24,18 @@ class _NoCookieFilter(logging.Filter):
 from process_videos import (
     recognize_song,
     build_description,
-    next_upload_slots,
+    iter_upload_slots,
+    last_booked_slot,
     load_state,
+    refresh_state,
+    recognise_all,
     save_state,
+    upload_lock,
     COOKIES_FILE,
     _clean_text,
 )
+from tiktok_uploader.types import VideoDict
 from tiktok_uploader.upload import TikTokUploader
-from datetime import datetime
 
 
 async def get_description(video: Path) -> tuple[str, str | None]:
@@ -50,6 +57,62 @@ async def get_description(video: Path) -> tuple[str, str | None]:
     return build_description(result), sound
 
 
+def upload_batch(videos: list[Path], state: dict, args: argparse.Namespace) -> None:
+    """Upload every pending video, `args.concurrency` browsers at a time."""
+    done = set(state.get("uploaded", []))
+    pending = [v for v in videos if v.name not in done]
+    if not pending:
+        print("No pending videos — everything is in uploaded.json")
+        return
+
+    # Same bounded decode/Shazam pipeline as process_videos.py
+    jobs = asyncio.run(recognise_all(pending, state.setdefault("audio_probes", {})))
+
+    with upload_lock():
+        # Another run may have booked videos/slots while we were recognising
+        refresh_state(state)
+        done = set(state["uploaded"])
+        jobs = [job for job in jobs if job[0].name not in done]
+        if not jobs:
+            print("No pending videos — everything is in uploaded.json")
+            return
+
+        # Book consecutive slots up front; the uploads then run side by side
+        slots = list(islice(iter_upload_slots(last_booked_slot(state)), len(jobs)))
+
+        batch: list[VideoDict] = []
+        for (video, description, sound), slot in zip(jobs, slots):
+            print(f"{video.name}: {slot.strftime('%Y-%m-%d %H:%M %Z')} — {description}")
+            # Pass as naive local time — upload.py handles UTC conversion
+            item: VideoDict = {
+                "path": str(video),
+                "description": description,
+                "schedule": slot.replace(tzinfo=None),
+            }
+            if sound:
+                item["sound"] = sound  # type: ignore[typeddict-unknown-key]
+            batch.append(item)
+        print()
+        print(f"Uploading {len(batch)} videos ({args.concurrency} at a time)…")
+
+        uploader = TikTokUploader(cookies=str(COOKIES_FILE), headless=args.headless)
+        failed = {
+            v["path"]
+            for v in uploader.upload_videos(batch, max_concurrency=args.concurrency)
+        }
+
+        booked = [
+            (video, slot)
+            for (video, _, _), slot in zip(jobs, slots)
+            if str(video) not in failed
+        ]
+        if booked:
+            state["uploaded"].extend(video.name for video, _ in booked)
+            state["last_slot"] = max(slot for _, slot in booked).isoformat()
+            save_state(state)
+    print(f"✓ {len(booked)} scheduled, ✗ {len(failed)} failed.")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Test-upload a single video to TikTok."
@@ -65,6 +128,17 @@ def main() -> None:
         action="store_true",
         help="Show ALL debug output including cookie messages (default: upload messages only)",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Upload every pending video in videos/ (or the given directory)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Browsers uploading side by side with --all (default: 4)",
+    )
     args = parser.parse_args()
 
     # Always show upload progress (DEBUG), but filter out noisy cookie lines.
@@ -78,6 +152,11 @@ def main() -> None:
             handler.addFilter(_cookie_filter)
     logging.getLogger("tiktok_uploader").setLevel(logging.DEBUG)
 
+    if args.all:
+        folder = Path(args.video or "videos")
+        upload_batch(sorted(folder.glob("*.mp4")), load_state(), args)
+        return
+
     if args.video:
         video = Path(args.video)
         # If a directory was passed, pick the first .mp4 inside it
@@ -108,25 +187,25 @@ def main() -> None:
         )
         return
 
-    last_slot_iso = state.get("last_slot")
-    last_slot = (
-        datetime.fromisoformat(last_slot_iso).astimezone() if last_slot_iso else None
-    )
-
     # Get next available slot in the 9AM–10PM window
-    slot = next_upload_slots(1, last_slot=last_slot)[0]
+    slot = next(iter_upload_slots(last_booked_slot(state)))
     # Pass as naive local time — upload.py handles UTC conversion
     slot_naive = slot.replace(tzinfo=None)
 
     print(f"Video      : {video.name}")
-    description, sound = asyncio.run(get_description(video))
+    uploader = TikTokUploader(cookies=str(COOKIES_FILE), headless=args.headless)
+    # Recognise the song on a worker thread while this thread launches the
+    # browser and logs in (sync Playwright must stay on the thread using it)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        recognition = pool.submit(asyncio.run, get_description(video))
+        uploader.page  # launches the browser and logs in
+        description, sound = recognition.result()
     print(f"Description: {description}")
     print(f"Sound      : {sound or '(none)'}")
     print(f"Schedule   : {slot.strftime('%Y-%m-%d %H:%M %Z')} (local time)")
     print()
     print("Uploading…")
 
-    uploader = TikTokUploader(cookies=str(COOKIES_FILE), headless=args.headless)
     success = uploader.upload_video(
         str(video), description=description, schedule=slot_naive, sound=sound
     )
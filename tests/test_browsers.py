@@ -5,8 +5,12 @@ Test the browsers module.
 from unittest.mock import MagicMock, patch
 
 import tiktok_uploader.browsers as browsers
+from tiktok_uploader import config
 
 
+@patch.object(config, "blocked_resource_types", ["image"])
+@patch.object(config, "blocked_hosts", [])
+@patch.object(config, "disable_animations", True)
 @patch("tiktok_uploader.browsers.sync_playwright")
 def test_get_browser(mock_sync_playwright):
     mock_p = MagicMock()
@@ -27,7 +31,64 @@ def test_get_browser(mock_sync_playwright):
     assert page == mock_page
     mock_p.chromium.launch.assert_called()
 
+    args, kwargs = mock_browser_type.launch.call_args
+    assert "--mute-audio" in kwargs["args"]
+    assert "--blink-settings=imagesEnabled=false" in kwargs["args"]
+
     # Check headless
     browsers.get_browser("chrome", headless=True)
     args, kwargs = mock_browser_type.launch.call_args
     assert kwargs["headless"] is True
+    mock_context.route.assert_called_with("**/*", browsers._block_unneeded_requests)
+    mock_context.add_init_script.assert_any_call(browsers.DISABLE_ANIMATIONS_SCRIPT)
+
+
+@patch("tiktok_uploader.browsers.sync_playwright")
+def test_get_browser_blocks_nothing_by_default(mock_sync_playwright):
+    mock_p = mock_sync_playwright.return_value.start.return_value
+    mock_context = mock_p.chromium.launch.return_value.new_context.return_value
+
+    browsers.get_browser("chrome")
+
+    args, kwargs = mock_p.chromium.launch.call_args
+    assert "--blink-settings=imagesEnabled=false" not in kwargs["args"]
+    mock_context.route.assert_not_called()
+    scripts = [c.args[0] for c in mock_context.add_init_script.call_args_list]
+    assert browsers.DISABLE_ANIMATIONS_SCRIPT not in scripts
+
+
+@patch.object(config, "blocked_resource_types", ["image"])
+@patch.object(config, "blocked_hosts", ["google-analytics.com"])
+def test_block_unneeded_requests():
+    image = MagicMock()
+    image.request.resource_type = "image"
+    image.request.url = "https://www.tiktok.com/logo.png"
+    browsers._block_unneeded_requests(image)
+    image.abort.assert_called_once()
+
+    tracker = MagicMock()
+    tracker.request.resource_type = "xhr"
+    tracker.request.url = "https://www.google-analytics.com/collect"
+    browsers._block_unneeded_requests(tracker)
+    tracker.abort.assert_called_once()
+
+    script = MagicMock()
+    script.request.resource_type = "script"
+    script.request.url = "https://www.tiktok.com/app.js"
+    browsers._block_unneeded_requests(script)
+    script.continue_.assert_called_once()
+    script.abort.assert_not_called()
+
+
+@patch("tiktok_uploader.browsers.sync_playwright")
+def test_close_browser_stops_playwright(mock_sync_playwright):
+    mock_p = mock_sync_playwright.return_value.start.return_value
+    mock_browser = mock_p.chromium.launch.return_value
+    page = mock_browser.new_context.return_value.new_page.return_value
+    page.context.browser = mock_browser
+
+    browsers.get_browser("chrome")
+    browsers.close_browser(page)
+
+    mock_browser.close.assert_called_once()
+    mock_p.stop.assert_called_once()
@@ -3,9 +3,17 @@ Tests for the TikTokUploader class
 """
 
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
-from tiktok_uploader.upload import TikTokUploader
+from tiktok_uploader import config
+from tiktok_uploader.types import VideoDict
+from tiktok_uploader.upload import (
+    TikTokUploader,
+    _page_pool,
+    close_pool,
+    upload_video,
+)
 
 FILENAME = "test.mp4"
 
@@ -82,3 +90,95 @@ def test_tiktok_uploader_reuse_browser(
 
     # Complete upload should be called twice
     assert mock_complete_upload.call_count == 2
+
+
+@patch("tiktok_uploader.upload.get_browser")
+@patch("tiktok_uploader.auth.AuthBackend.authenticate_agent")
+@patch("tiktok_uploader.upload.complete_upload_form")
+def test_tiktok_uploader_concurrent_uploads(
+    mock_complete_upload, mock_auth, mock_browser
+) -> None:
+    """
+    Tests that max_concurrency spreads videos across separate browsers
+    """
+    mock_page = MagicMock()
+    mock_browser.return_value = mock_page
+    mock_auth.return_value = mock_page
+
+    uploader = TikTokUploader(sessionid="test_session")
+    videos: list[VideoDict] = [
+        {"path": FILENAME, "description": f"Test {i}"} for i in range(4)
+    ]
+
+    failed = uploader.upload_videos(videos, max_concurrency=2)
+
+    assert failed == []
+    # One browser per worker, none on the parent uploader
+    assert mock_browser.call_count == 2
+    assert mock_complete_upload.call_count == 4
+    assert uploader._page is None
+
+
+@patch.object(config, "quit_on_end", False)
+@patch("tiktok_uploader.upload.get_browser")
+@patch("tiktok_uploader.auth.AuthBackend.authenticate_agent")
+@patch("tiktok_uploader.upload.complete_upload_form")
+def test_upload_video_reuses_pooled_browser(
+    mock_complete_upload, mock_auth, mock_browser
+) -> None:
+    """
+    Tests that repeated upload_video calls reuse one warm, authenticated page
+    when quit_on_end is off
+    """
+    mock_page = MagicMock()
+    mock_page.is_closed.return_value = False
+    mock_browser.return_value = mock_page
+    mock_auth.return_value = mock_page
+
+    try:
+        upload_video(FILENAME, description="Test 1", sessionid="test_session")
+        upload_video(FILENAME, description="Test 2", sessionid="test_session")
+
+        mock_browser.assert_called_once()
+        mock_auth.assert_called_once()
+        assert mock_complete_upload.call_count == 2
+
+        # another thread never sees this thread's pages
+        seen: list[int] = []
+        thread = threading.Thread(target=lambda: seen.append(len(_page_pool())))
+        thread.start()
+        thread.join()
+        assert seen == [0]
+    finally:
+        close_pool()
+
+    mock_page.context.browser.close.assert_called_once()
+    assert not _page_pool()
+
+
+@patch("tiktok_uploader.upload.complete_upload_form")
+def test_upload_prepared_skips_schedules_gone_stale(mock_complete_upload) -> None:
+    """
+    Tests that a schedule which passed batch validation but is now too close
+    is reported as failed instead of being posted
+    """
+    import datetime
+
+    from tiktok_uploader.upload import _PreparedVideo
+
+    now = datetime.datetime.now(datetime.timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+    stale: VideoDict = {"path": FILENAME}
+    fresh: VideoDict = {"path": FILENAME}
+    prepared = [
+        _PreparedVideo(stale, FILENAME, None, now),
+        _PreparedVideo(fresh, FILENAME, None, now + datetime.timedelta(hours=3)),
+    ]
+    uploader = TikTokUploader(sessionid="test_session")
+    uploader._page = MagicMock()
+
+    failed = uploader._upload_prepared(prepared, 1, False, None)
+
+    assert failed == [stale]
+    mock_complete_upload.assert_called_once()
@@ -6,8 +6,8 @@ import datetime
 import os
 from typing import Literal
 from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
 
-import pytz
 from freezegun import freeze_time
 from pytest import raises
 
@@ -22,7 +22,7 @@ from tiktok_uploader.upload import (
 
 # before each create a file called test.mp4 and test.jpg
 FILENAME = "test.mp4"
-timezone = pytz.UTC
+timezone = datetime.timezone.utc
 
 
 def setup_function() -> None:
@@ -101,23 +101,23 @@ def test_get_valid_schedule_minute() -> None:
     valid_tiktok_multiple = 5
 
     schedule = datetime.datetime(2023, 1, 1, 12, 56)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _get_valid_schedule_minute(schedule, valid_tiktok_multiple).minute == 0
 
     schedule = datetime.datetime(2023, 1, 1, 12, 9)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _get_valid_schedule_minute(schedule, valid_tiktok_multiple).minute == 10
 
     schedule = datetime.datetime(2023, 1, 1, 12, 5)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _get_valid_schedule_minute(schedule, valid_tiktok_multiple).minute == 5
 
     schedule = datetime.datetime(2023, 1, 1, 12, 0)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _get_valid_schedule_minute(schedule, valid_tiktok_multiple).minute == 0
 
     schedule = datetime.datetime(2023, 1, 1, 12, 30)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _get_valid_schedule_minute(schedule, valid_tiktok_multiple).minute == 30
 
 
@@ -128,19 +128,19 @@ def test_check_valid_schedule_min_limit() -> None:
     """
 
     schedule = datetime.datetime(2020, 1, 1, 12, 25)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
     schedule = datetime.datetime(2020, 1, 1, 12, 20)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
     schedule = datetime.datetime(2020, 1, 1, 12, 15)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
     schedule = datetime.datetime(2019, 1, 1, 12, 00)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
 
@@ -151,23 +151,23 @@ def test_check_valid_schedule_max_limit() -> None:
     """
 
     schedule = datetime.datetime(2020, 1, 9, 12, 00)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
     schedule = datetime.datetime(2020, 1, 10, 11, 55)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
     schedule = datetime.datetime(2020, 1, 11, 12, 00)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
     schedule = datetime.datetime(2020, 1, 11, 12, 5)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
     schedule = datetime.datetime(2021, 1, 11, 12, 5)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
 
@@ -178,30 +178,60 @@ def test_check_valid_schedule_minute_valid() -> None:
     """
 
     schedule = datetime.datetime(2020, 1, 2, 12, 00)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
     schedule = datetime.datetime(2020, 1, 2, 12, 1)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
     schedule = datetime.datetime(2020, 1, 2, 12, 2)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
     schedule = datetime.datetime(2020, 1, 2, 12, 3)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
     schedule = datetime.datetime(2020, 1, 2, 12, 4)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is False
 
     schedule = datetime.datetime(2020, 1, 2, 12, 5)
-    schedule = timezone.localize(schedule)
+    schedule = schedule.replace(tzinfo=timezone)
     assert _check_valid_schedule(schedule) is True
 
 
+@freeze_time("2020-01-01 12:00")
+def test_prepare_batch_rejects_invalid_schedule() -> None:
+    """
+    Tests that _prepare_batch resolves paths and fails bad schedules up front
+    """
+    from tiktok_uploader.upload import _prepare_batch
+
+    good = datetime.datetime(2020, 1, 2, 12, 0)
+    past = datetime.datetime(2019, 1, 1, 12, 0)
+    videos: list[VideoDict] = [
+        {"path": FILENAME, "schedule": good},
+        {"path": FILENAME, "schedule": past},
+    ]
+
+    prepared, failed = _prepare_batch(videos)
+
+    assert failed == [videos[1]]
+    assert len(prepared) == 1
+    assert prepared[0].path == os.path.abspath(FILENAME)
+    assert prepared[0].schedule == good.astimezone(timezone)
+
+    # Aware UTC schedules are accepted as they are
+    aware: list[VideoDict] = [
+        {"path": FILENAME, "schedule": good.replace(tzinfo=timezone)}
+    ]
+    prepared, failed = _prepare_batch(aware)
+    assert failed == []
+    assert prepared[0].schedule == good.replace(tzinfo=timezone)
+
+
 def test_convert_videos_dict_with_visibility() -> None:
     """
     Tests that visibility parameter is properly handled in video dict conversion
@@ -342,6 +372,134 @@ def test_set_visibility_dropdown_interaction() -> None:
     mock_page.locator.return_value.click.assert_called()
 
 
+def test_set_interactivity_reads_states_once() -> None:
+    """
+    Tests that _set_interactivity reads all checkbox states in one evaluate
+    and only clicks the boxes that need toggling
+    """
+    from tiktok_uploader.upload import _set_interactivity
+
+    mock_page = MagicMock()
+    boxes: dict[str, MagicMock] = {}
+    mock_page.locator.side_effect = lambda sel: boxes.setdefault(sel, MagicMock())
+    mock_page.evaluate.return_value = [True, False, True]  # comment, stitch, duet
+
+    _set_interactivity(mock_page, comment=True, stitch=True, duet=False)
+
+    mock_page.evaluate.assert_called_once()
+    comment_box, stitch_box, duet_box = boxes.values()
+    comment_box.click.assert_not_called()
+    stitch_box.click.assert_called_once()
+    duet_box.click.assert_called_once()
+
+
+def test_set_description_types_plain_words_together() -> None:
+    """
+    Tests that _set_description inserts runs of plain words in one call and
+    only types hashtags key by key
+    """
+    from tiktok_uploader.upload import _set_description
+
+    mock_page = MagicMock()
+    desc_locator = MagicMock()
+    mock_page.locator.return_value = desc_locator
+
+    _set_description(mock_page, "hello there #tag more words")
+
+    desc_locator.fill.assert_called_once_with("")
+    inserted = [c.args[0] for c in mock_page.keyboard.insert_text.call_args_list]
+    assert inserted == ["hello there ", "more words "]
+    desc_locator.press_sequentially.assert_called_once_with("#tag", delay=50)
+
+
+def test_first_visible_resolves_candidates_in_one_call() -> None:
+    """
+    Tests that _first_visible evaluates every candidate XPath at once and
+    returns a locator only for the one that resolved
+    """
+    from tiktok_uploader.upload import _first_visible
+
+    mock_page = MagicMock()
+    mock_page.evaluate.return_value = 1
+
+    found = _first_visible(mock_page, ("//a", "//b"))
+
+    mock_page.evaluate.assert_called_once()
+    mock_page.locator.assert_called_once_with("xpath=//b")
+    assert found is mock_page.locator.return_value.first
+
+    mock_page.evaluate.return_value = -1
+    assert _first_visible(mock_page, ("//a", "//b")) is None
+
+
+def test_browser_timezone_is_cached_per_page() -> None:
+    """
+    Tests that the browser's timezone is only evaluated once per page
+    """
+    from tiktok_uploader.upload import _browser_timezone
+
+    mock_page = MagicMock()
+    mock_page.evaluate.return_value = "Europe/Berlin"
+
+    assert _browser_timezone(mock_page) == ZoneInfo("Europe/Berlin")
+    assert _browser_timezone(mock_page) == ZoneInfo("Europe/Berlin")
+    mock_page.evaluate.assert_called_once()
+
+
+def test_remove_cookies_window_only_once_per_page() -> None:
+    """
+    Tests that the cookie banner is not probed again once it was dismissed
+    """
+    from tiktok_uploader.upload import _remove_cookies_window
+
+    mock_page = MagicMock()
+    button = mock_page.locator.return_value.first
+    button.is_visible.return_value = True
+
+    _remove_cookies_window(mock_page)
+    _remove_cookies_window(mock_page)
+
+    button.click.assert_called_once()
+    mock_page.locator.assert_called_once()
+
+
+def test_set_video_runs_callback_while_processing() -> None:
+    """
+    Tests that _set_video runs `while_processing` after handing over the file
+    and before waiting for processing to finish
+    """
+    from tiktok_uploader.upload import _set_video
+
+    mock_page = MagicMock()
+    calls = []
+    locator = mock_page.locator.return_value
+    locator.set_input_files.side_effect = lambda path: calls.append("upload")
+    locator.wait_for.side_effect = lambda **kwargs: calls.append("wait")
+
+    _set_video(mock_page, FILENAME, while_processing=lambda: calls.append("form"))
+
+    assert calls == ["upload", "form", "wait"]
+
+
+def test_set_description_selects_mention_from_one_lookup() -> None:
+    """
+    Tests that _set_description reads all mention suggestions at once and
+    arrows down to the matching user
+    """
+    from tiktok_uploader.upload import _set_description
+
+    mock_page = MagicMock()
+    locator = MagicMock()
+    mock_page.locator.return_value = locator
+    locator.evaluate_all.return_value = ["alice", None, "Bob"]
+
+    _set_description(mock_page, "@bob")
+
+    locator.evaluate_all.assert_called_once()
+    keys = [c.args[0] for c in locator.press.call_args_list]
+    assert keys == ["ArrowDown", "ArrowDown", "Enter"]
+
+
 def test_video_dict_type_with_visibility() -> None:
     """
     Tests that VideoDict TypedDict includes visibility field
@@ -389,3 +547,53 @@ def test_upload_videos_with_browser_agent_authenticates(
     )
 
     mock_authenticate_agent.assert_called_once_with(browser_agent)
+
+
+def test_xpath_literal_quotes_apostrophes() -> None:
+    """
+    Tests that sound titles with quotes still produce valid XPath literals
+    """
+    from tiktok_uploader.upload import _xpath_literal
+
+    assert _xpath_literal("Believer") == "'Believer'"
+    assert _xpath_literal("Don't") == '"Don\'t"'
+    assert _xpath_literal("""It's "it\"""") == """concat('It', "'", 's "it"')"""
+
+
+def test_set_video_does_not_retry_on_description_error() -> None:
+    """
+    Tests that a failure in the `while_processing` callback is reported as a
+    description failure instead of re-uploading the video
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    from tiktok_uploader.upload import FailedToSetDescription, _set_video
+
+    mock_page = MagicMock()
+    locator = mock_page.locator.return_value
+
+    def fail() -> None:
+        raise PlaywrightTimeoutError("description box never appeared")
+
+    with raises(FailedToSetDescription):
+        _set_video(mock_page, FILENAME, num_retries=3, while_processing=fail)
+
+    locator.set_input_files.assert_called_once()
+    locator.wait_for.assert_not_called()
+
+
+def test_remove_cookies_window_retries_after_js_fallback() -> None:
+    """
+    Tests that removing the banner node alone does not stop later checks,
+    as the banner comes back when the page reloads
+    """
+    from tiktok_uploader.upload import _remove_cookies_window
+
+    mock_page = MagicMock()
+    button = mock_page.locator.return_value.first
+    button.is_visible.side_effect = Exception("banner not ready")
+
+    _remove_cookies_window(mock_page)
+    _remove_cookies_window(mock_page)
+
+    assert mock_page.evaluate.call_count == 2